@@ -6,8 +6,10 @@ This module provides functionality for:
 - Managing catalog metadata
 """
 
-from pathlib import Path
+import os
+from collections.abc import Iterator
 from datetime import datetime
+from pathlib import Path
 
 from resourcelibrarian.models.catalog import LibraryCatalog
 from resourcelibrarian.models.book import Book
@@ -112,6 +114,33 @@ class CatalogManager:
             last_updated=catalog_data.get("last_updated"),
         )
 
+    @staticmethod
+    def _resource_folders(root: Path) -> Iterator[Path]:
+        """Yield the resource folders two levels below a books/ or videos/ root.
+
+        Uses os.scandir so directory checks come from the cached entry type
+        rather than a stat() per entry.
+
+        Args:
+            root: books/ or videos/ directory
+
+        Yields:
+            Paths of folders under each group folder, skipping _index
+        """
+        try:
+            with os.scandir(root) as entries:
+                groups = [
+                    entry.path for entry in entries if entry.name != "_index" and entry.is_dir()
+                ]
+        except FileNotFoundError:
+            return
+
+        for group in groups:
+            with os.scandir(group) as entries:
+                folders = [entry.path for entry in entries if entry.is_dir()]
+            for folder in folders:
+                yield Path(folder)
+
     def rebuild_catalog(self) -> LibraryCatalog:
         """Rebuild catalog by scanning the filesystem.
 
@@ -124,50 +153,30 @@ class CatalogManager:
         books = []
         videos = []
 
-        # Scan books directory
-        if self.books_dir.exists():
-            for author_dir in self.books_dir.iterdir():
-                # Skip _index directory
-                if author_dir.name == "_index" or not author_dir.is_dir():
+        # Scan books directory (author/book folders)
+        for book_dir in self._resource_folders(self.books_dir):
+            manifest_path = book_dir / "manifest.yaml"
+            if manifest_path.exists():
+                try:
+                    book = Book.from_folder(book_dir)
+                    books.append(book)
+                except Exception as e:
+                    # Log error but continue scanning
+                    print(f"Warning: Failed to load book from {book_dir}: {e}")
                     continue
 
-                # Scan each book folder
-                for book_dir in author_dir.iterdir():
-                    if not book_dir.is_dir():
-                        continue
-
-                    manifest_path = book_dir / "manifest.yaml"
-                    if manifest_path.exists():
-                        try:
-                            book = Book.from_folder(book_dir)
-                            books.append(book)
-                        except Exception as e:
-                            # Log error but continue scanning
-                            print(f"Warning: Failed to load book from {book_dir}: {e}")
-                            continue
-
-        # Scan videos directory
-        if self.videos_dir.exists():
-            for channel_dir in self.videos_dir.iterdir():
-                # Skip _index directory
-                if channel_dir.name == "_index" or not channel_dir.is_dir():
+        # Scan videos directory (channel/video folders)
+        for video_dir in self._resource_folders(self.videos_dir):
+            manifest_path = video_dir / "manifest.yaml"
+            if manifest_path.exists():
+                try:
+                    video = Video.from_folder(video_dir)
+                    videos.append(video)
+                except Exception as e:
+                    # Log error but continue scanning
+                    print(f"Warning: Failed to load video from {video_dir}: {e}")
                     continue
 
-                # Scan each video folder
-                for video_dir in channel_dir.iterdir():
-                    if not video_dir.is_dir():
-                        continue
-
-                    manifest_path = video_dir / "manifest.yaml"
-                    if manifest_path.exists():
-                        try:
-                            video = Video.from_folder(video_dir)
-                            videos.append(video)
-                        except Exception as e:
-                            # Log error but continue scanning
-                            print(f"Warning: Failed to load video from {video_dir}: {e}")
-                            continue
-
         # Create and save catalog
         catalog = LibraryCatalog(
             books=books,
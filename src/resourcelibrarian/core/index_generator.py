@@ -8,10 +8,11 @@ This module generates beautiful Markdown index files for navigation:
 - Category indices
 """
 
+import os
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
-from typing import List, Dict
+from typing import Iterable, List, Dict
 
 from resourcelibrarian.models.catalog import LibraryCatalog
 from resourcelibrarian.models.book import Book
@@ -60,6 +61,36 @@ class IndexGenerator:
         for video in catalog.videos:
             self.generate_video_index(video)
 
+    @staticmethod
+    def _existing_paths(paths: Iterable[Path]) -> set[Path]:
+        """Find which of the given paths exist, listing each parent directory once.
+
+        A resource's format, summary and transcript files mostly share a few folders,
+        so one os.scandir per folder replaces an exists() stat per file.
+
+        Args:
+            paths: Candidate file paths
+
+        Returns:
+            The subset of paths that exist (symlinks only if their target exists)
+        """
+        by_parent: dict[Path, list[Path]] = defaultdict(list)
+        for path in paths:
+            by_parent[path.parent].append(path)
+
+        existing = set()
+        for parent, children in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    entries = {entry.name: entry for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for path in children:
+                entry = entries.get(path.name)
+                if entry is not None and (not entry.is_symlink() or os.path.exists(entry.path)):
+                    existing.add(path)
+        return existing
+
     def _get_timestamp(self) -> str:
         """Get formatted timestamp for index files."""
         return datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -791,26 +822,30 @@ class IndexGenerator:
             lines.append(f"**Categories:** {', '.join(cat_links)}")
             lines.append("")
 
-        # Full book formats
         formats = book.list_formats()
+        summaries = book.list_summaries()
+        format_paths = {fmt: book.get_format_path(fmt) for fmt in formats}
+        summary_paths = {summary: book.get_summary_path(summary) for summary in summaries}
+        existing = self._existing_paths([*format_paths.values(), *summary_paths.values()])
+
+        # Full book formats
         if formats:
             lines.append("## Full Book Formats")
             lines.append("")
             for fmt in formats:
-                format_path = book.get_format_path(fmt)
-                if format_path and format_path.exists():
+                format_path = format_paths[fmt]
+                if format_path in existing:
                     rel_path = format_path.relative_to(book.folder_path)
                     lines.append(f"- **{fmt.upper()}**: [{format_path.name}]({rel_path})")
             lines.append("")
 
         # Summaries
-        summaries = book.list_summaries()
         if summaries:
             lines.append("## Summaries")
             lines.append("")
             for summary in summaries:
-                summary_path = book.get_summary_path(summary)
-                if summary_path and summary_path.exists():
+                summary_path = summary_paths[summary]
+                if summary_path in existing:
                     rel_path = summary_path.relative_to(book.folder_path)
                     # Clean up the summary name for display
                     display_name = summary_path.stem.replace("-", " ").title()
@@ -890,9 +925,16 @@ class IndexGenerator:
             lines.append(f"> {video.manifest.description}")
             lines.append("")
 
-        # Transcript
         transcript_path = video.get_transcript_path()
-        if transcript_path and transcript_path.exists():
+        summaries = video.list_summaries()
+        summary_paths = {summary: video.get_summary_path(summary) for summary in summaries}
+        candidates = [*summary_paths.values()]
+        if transcript_path:
+            candidates.append(transcript_path)
+        existing = self._existing_paths(candidates)
+
+        # Transcript
+        if transcript_path in existing:
             rel_path = transcript_path.relative_to(video.folder_path)
             lines.append("## Transcript")
             lines.append("")
@@ -900,13 +942,12 @@ class IndexGenerator:
             lines.append("")
 
         # Summaries
-        summaries = video.list_summaries()
         if summaries:
             lines.append("## Summaries")
             lines.append("")
             for summary in summaries:
-                summary_path = video.get_summary_path(summary)
-                if summary_path and summary_path.exists():
+                summary_path = summary_paths[summary]
+                if summary_path in existing:
                     rel_path = summary_path.relative_to(video.folder_path)
                     display_name = summary_path.stem.replace("-", " ").title()
                     lines.append(f"- **{display_name}**: [{summary_path.name}]({rel_path})")
@@ -5,6 +5,18 @@ from pathlib import Path
 from resourcelibrarian.models.catalog import LibraryCatalog
 
 
+def _write_index_placeholders(root: Path) -> None:
+    """Write the placeholder index markdown files of a new library.
+
+    Args:
+        root: Library root whose _index directories already exist
+    """
+    (root / "_index" / "README.md").write_text("# Library Index\n\n")
+    (root / "books" / "_index" / "authors.md").write_text("# Authors Index\n\n")
+    (root / "books" / "_index" / "titles.md").write_text("# Titles Index\n\n")
+    (root / "videos" / "_index" / "channels.md").write_text("# Channels Index\n\n")
+
+
 class ResourceLibrary:
     """Main class for managing a Resource Library.
 
@@ -85,24 +97,19 @@ class ResourceLibrary:
         catalog_mgr.save_catalog(empty_catalog)
 
         # Create library-wide index directory
-        library_index_dir = root / "_index"
-        library_index_dir.mkdir()
-        (library_index_dir / "README.md").write_text("# Library Index\n\n")
+        (root / "_index").mkdir()
 
         # Create books directory structure
         books_dir = root / "books"
         books_dir.mkdir()
-        books_index_dir = books_dir / "_index"
-        books_index_dir.mkdir()
-        (books_index_dir / "authors.md").write_text("# Authors Index\n\n")
-        (books_index_dir / "titles.md").write_text("# Titles Index\n\n")
+        (books_dir / "_index").mkdir()
 
         # Create videos directory structure
         videos_dir = root / "videos"
         videos_dir.mkdir()
-        videos_index_dir = videos_dir / "_index"
-        videos_index_dir.mkdir()
-        (videos_index_dir / "channels.md").write_text("# Channels Index\n\n")
+        (videos_dir / "_index").mkdir()
+
+        _write_index_placeholders(root)
 
         return cls(root)
 
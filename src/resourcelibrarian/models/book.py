@@ -93,10 +93,8 @@ class Book(BaseModel):
         Returns:
             Absolute path to the format file, or None if not found
         """
-        if format_type in self.manifest.formats:
-            rel_path = self.manifest.formats[format_type]
-            return self.folder_path / rel_path
-        return None
+        rel_path = self.manifest.formats.get(format_type)
+        return self.folder_path / rel_path if rel_path is not None else None
 
     def get_summary_path(self, summary_type: str) -> Optional[Path]:
         """Get absolute path to a specific summary file.
@@ -107,10 +105,8 @@ class Book(BaseModel):
         Returns:
             Absolute path to the summary file, or None if not found
         """
-        if summary_type in self.manifest.summaries:
-            rel_path = self.manifest.summaries[summary_type]
-            return self.folder_path / rel_path
-        return None
+        rel_path = self.manifest.summaries.get(summary_type)
+        return self.folder_path / rel_path if rel_path is not None else None
 
     def list_formats(self) -> list[str]:
         """List available format types.
@@ -144,8 +140,11 @@ class Book(BaseModel):
         # Import here to avoid circular dependency
         from resourcelibrarian.utils.io import load_book_manifest
 
-        if not folder_path.exists():
-            raise FileNotFoundError(f"Book folder not found: {folder_path}")
-
-        manifest = load_book_manifest(folder_path)
+        try:
+            manifest = load_book_manifest(folder_path)
+        except FileNotFoundError:
+            # Only stat the folder on failure, to tell a missing folder from a missing manifest
+            if not folder_path.exists():
+                raise FileNotFoundError(f"Book folder not found: {folder_path}") from None
+            raise
         return cls(folder_path=folder_path, manifest=manifest)
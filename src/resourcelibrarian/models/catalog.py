@@ -1,5 +1,6 @@
 """Catalog models for Resource Librarian."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Optional
 
@@ -63,10 +64,7 @@ class LibraryCatalog(BaseModel):
             Book instance if found, None otherwise
         """
         title_lower = title.lower()
-        for book in self.books:
-            if book.title.lower() == title_lower:
-                return book
-        return None
+        return next((book for book in self.books if book.title.lower() == title_lower), None)
 
     def find_video(self, video_id: str) -> Optional[Video]:
         """Find a video by YouTube video ID.
@@ -77,10 +75,7 @@ class LibraryCatalog(BaseModel):
         Returns:
             Video instance if found, None otherwise
         """
-        for video in self.videos:
-            if video.video_id == video_id:
-                return video
-        return None
+        return next((video for video in self.videos if video.video_id == video_id), None)
 
     def find_video_by_title(self, title: str) -> Optional[Video]:
         """Find a video by exact title match.
@@ -92,19 +87,19 @@ class LibraryCatalog(BaseModel):
             Video instance if found, None otherwise
         """
         title_lower = title.lower()
-        for video in self.videos:
-            if video.title.lower() == title_lower:
-                return video
-        return None
+        return next((video for video in self.videos if video.title.lower() == title_lower), None)
 
-    def search_books(
+    def iter_books(
         self,
         author: Optional[str] = None,
         category: Optional[str] = None,
         tag: Optional[str] = None,
         title: Optional[str] = None,
-    ) -> list[Book]:
-        """Search books with optional filters.
+    ) -> Iterator[Book]:
+        """Lazily yield books matching optional filters, in catalog order.
+
+        Callers that stop early, such as taking the first few matches, don't
+        check the remaining books.
 
         Args:
             author: Filter by author (case-insensitive substring match)
@@ -112,42 +107,69 @@ class LibraryCatalog(BaseModel):
             tag: Filter by tag (case-insensitive substring match)
             title: Filter by title (case-insensitive substring match)
 
-        Returns:
-            List of matching Book instances
+        Yields:
+            Matching Book instances
         """
-        results = []
-
+        # Lowercase each filter once rather than once per book
+        author = author.lower() if author else None
+        category = category.lower() if category else None
+        tag = tag.lower() if tag else None
+        title = title.lower() if title else None
+
+        # Single-string filters run before the category/tag scans, so most
+        # non-matching books are rejected without walking their lists
         for book in self.books:
             # Check author filter
-            if author and author.lower() not in book.author.lower():
+            if author and author not in book.author.lower():
+                continue
+
+            # Check title filter
+            if title and title not in book.title.lower():
                 continue
 
             # Check category filter
             if category:
-                if not any(category.lower() in cat.lower() for cat in book.categories):
+                if not any(category in cat.lower() for cat in book.categories):
                     continue
 
             # Check tag filter
             if tag:
-                if not any(tag.lower() in t.lower() for t in book.tags):
+                if not any(tag in t.lower() for t in book.tags):
                     continue
 
-            # Check title filter
-            if title and title.lower() not in book.title.lower():
-                continue
+            yield book
 
-            results.append(book)
+    def search_books(
+        self,
+        author: Optional[str] = None,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> list[Book]:
+        """Search books with optional filters.
+
+        Args:
+            author: Filter by author (case-insensitive substring match)
+            category: Filter by category (case-insensitive substring match)
+            tag: Filter by tag (case-insensitive substring match)
+            title: Filter by title (case-insensitive substring match)
 
-        return results
+        Returns:
+            List of matching Book instances
+        """
+        return list(self.iter_books(author=author, category=category, tag=tag, title=title))
 
-    def search_videos(
+    def iter_videos(
         self,
         channel: Optional[str] = None,
         category: Optional[str] = None,
         tag: Optional[str] = None,
         title: Optional[str] = None,
-    ) -> list[Video]:
-        """Search videos with optional filters.
+    ) -> Iterator[Video]:
+        """Lazily yield videos matching optional filters, in catalog order.
+
+        Callers that stop early, such as taking the first few matches, don't
+        check the remaining videos.
 
         Args:
             channel: Filter by channel title (case-insensitive substring match)
@@ -155,33 +177,56 @@ class LibraryCatalog(BaseModel):
             tag: Filter by tag (case-insensitive substring match)
             title: Filter by title (case-insensitive substring match)
 
-        Returns:
-            List of matching Video instances
+        Yields:
+            Matching Video instances
         """
-        results = []
+        # Lowercase each filter once rather than once per video
+        channel = channel.lower() if channel else None
+        category = category.lower() if category else None
+        tag = tag.lower() if tag else None
+        title = title.lower() if title else None
 
+        # Single-string filters first, as in search_books
         for video in self.videos:
             # Check channel filter
-            if channel and channel.lower() not in video.channel_title.lower():
+            if channel and channel not in video.channel_title.lower():
+                continue
+
+            # Check title filter
+            if title and title not in video.title.lower():
                 continue
 
             # Check category filter
             if category:
-                if not any(category.lower() in cat.lower() for cat in video.manifest.categories):
+                if not any(category in cat.lower() for cat in video.manifest.categories):
                     continue
 
             # Check tag filter
             if tag:
-                if not any(tag.lower() in t.lower() for t in video.tags):
+                if not any(tag in t.lower() for t in video.tags):
                     continue
 
-            # Check title filter
-            if title and title.lower() not in video.title.lower():
-                continue
+            yield video
 
-            results.append(video)
+    def search_videos(
+        self,
+        channel: Optional[str] = None,
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> list[Video]:
+        """Search videos with optional filters.
+
+        Args:
+            channel: Filter by channel title (case-insensitive substring match)
+            category: Filter by category (case-insensitive substring match)
+            tag: Filter by tag (case-insensitive substring match)
+            title: Filter by title (case-insensitive substring match)
 
-        return results
+        Returns:
+            List of matching Video instances
+        """
+        return list(self.iter_videos(channel=channel, category=category, tag=tag, title=title))
 
     def get_all_authors(self) -> list[str]:
         """Get sorted list of unique authors.
@@ -230,17 +275,35 @@ class LibraryCatalog(BaseModel):
         Returns:
             Dictionary with various library statistics
         """
-        total_book_formats = sum(len(book.list_formats()) for book in self.books)
-        total_book_summaries = sum(len(book.list_summaries()) for book in self.books)
-        total_video_summaries = sum(len(video.list_summaries()) for video in self.videos)
+        # One pass over each list; counting unique values needs no sorting
+        authors = set()
+        categories = set()
+        tags = set()
+        total_book_formats = 0
+        total_book_summaries = 0
+        total_video_summaries = 0
+
+        for book in self.books:
+            manifest = book.manifest
+            authors.add(manifest.author)
+            categories.update(manifest.categories)
+            tags.update(manifest.tags)
+            total_book_formats += len(manifest.formats)
+            total_book_summaries += len(manifest.summaries)
+
+        for video in self.videos:
+            manifest = video.manifest
+            categories.update(manifest.categories)
+            tags.update(manifest.tags)
+            total_video_summaries += len(manifest.summaries)
 
         return {
             "total_books": len(self.books),
             "total_videos": len(self.videos),
             "total_items": len(self.books) + len(self.videos),
-            "unique_authors": len(self.get_all_authors()),
-            "unique_categories": len(self.get_all_categories()),
-            "unique_tags": len(self.get_all_tags()),
+            "unique_authors": len(authors),
+            "unique_categories": len(categories),
+            "unique_tags": len(tags),
             "book_formats": total_book_formats,
             "book_summaries": total_book_summaries,
             "video_summaries": total_video_summaries,
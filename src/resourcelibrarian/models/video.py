@@ -116,10 +116,8 @@ class Video(BaseModel):
         Returns:
             Absolute path to transcript, or None if not found
         """
-        if "transcript_path" in self.manifest.source:
-            rel_path = self.manifest.source["transcript_path"]
-            return self.folder_path / rel_path
-        return None
+        rel_path = self.manifest.source.get("transcript_path")
+        return self.folder_path / rel_path if rel_path is not None else None
 
     def get_url_path(self) -> Optional[Path]:
         """Get absolute path to the video URL file.
@@ -127,10 +125,8 @@ class Video(BaseModel):
         Returns:
             Absolute path to URL file, or None if not found
         """
-        if "url_file" in self.manifest.source:
-            rel_path = self.manifest.source["url_file"]
-            return self.folder_path / rel_path
-        return None
+        rel_path = self.manifest.source.get("url_file")
+        return self.folder_path / rel_path if rel_path is not None else None
 
     def get_summary_path(self, summary_type: str) -> Optional[Path]:
         """Get absolute path to a specific summary file.
@@ -141,10 +137,8 @@ class Video(BaseModel):
         Returns:
             Absolute path to the summary file, or None if not found
         """
-        if summary_type in self.manifest.summaries:
-            rel_path = self.manifest.summaries[summary_type]
-            return self.folder_path / rel_path
-        return None
+        rel_path = self.manifest.summaries.get(summary_type)
+        return self.folder_path / rel_path if rel_path is not None else None
 
     def list_summaries(self) -> list[str]:
         """List available summary types.
@@ -170,8 +164,11 @@ class Video(BaseModel):
         # Import here to avoid circular dependency
         from resourcelibrarian.utils.io import load_video_manifest
 
-        if not folder_path.exists():
-            raise FileNotFoundError(f"Video folder not found: {folder_path}")
-
-        manifest = load_video_manifest(folder_path)
+        try:
+            manifest = load_video_manifest(folder_path)
+        except FileNotFoundError:
+            # Only stat the folder on failure, to tell a missing folder from a missing manifest
+            if not folder_path.exists():
+                raise FileNotFoundError(f"Video folder not found: {folder_path}") from None
+            raise
         return cls(folder_path=folder_path, manifest=manifest)
@@ -1,9 +1,10 @@
 """Book ingestion - add books to the resource library."""
 
-import re
 import shutil
 from pathlib import Path
 
+from ebooklib import epub
+
 from resourcelibrarian.models import Book, BookManifest
 from resourcelibrarian.sources.book_folder_scanner import BookFolderScanner
 from resourcelibrarian.sources.book_parser import (
@@ -13,21 +14,7 @@ from resourcelibrarian.sources.book_parser import (
 )
 from resourcelibrarian.sources.epub_chapter_extractor import EpubChapterExtractor
 from resourcelibrarian.utils import save_book_manifest
-
-
-def slugify(text: str) -> str:
-    """Convert text to a URL-safe slug.
-
-    Args:
-        text: Text to slugify
-
-    Returns:
-        Slugified text
-    """
-    text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
-    return text.strip("-")
+from resourcelibrarian.utils.slug import slugify
 
 
 def parse_author_name(author: str) -> tuple[str, str]:
@@ -162,15 +149,20 @@ class BookIngestion:
                 key=lambda p: format_priority.get(BookParser.detect_format(p) or "", 0),
             )
 
-        # Parse the book content
-        text_content = BookParser.parse(extraction_file)
+        # Parse the book content, reading an EPUB once for both its text and metadata
+        epub_book = None
+        if extraction_file.suffix.lower() == ".epub":
+            epub_book = epub.read_epub(extraction_file)
+            text_content = BookParser.parse_epub(extraction_file, book=epub_book)
+        else:
+            text_content = BookParser.parse(extraction_file)
         text_content = clean_text(text_content)
 
         # Extract metadata if not provided
         if not title or not author:
             # Try EPUB metadata first if available
             if extraction_file.suffix.lower() == ".epub":
-                epub_metadata = BookParser.extract_epub_metadata(extraction_file)
+                epub_metadata = BookParser.extract_epub_metadata(extraction_file, book=epub_book)
                 if not title and epub_metadata.get("title"):
                     title = epub_metadata["title"]
                 if not author and epub_metadata.get("author"):
@@ -311,15 +303,20 @@ class BookIngestion:
         if not extraction_file:
             raise ValueError("No suitable format found for text extraction")
 
-        # Parse the book content
-        text_content = BookParser.parse(extraction_file)
+        # Parse the book content, reading an EPUB once for both its text and metadata
+        epub_book = None
+        if extraction_file.suffix.lower() == ".epub":
+            epub_book = epub.read_epub(extraction_file)
+            text_content = BookParser.parse_epub(extraction_file, book=epub_book)
+        else:
+            text_content = BookParser.parse(extraction_file)
         text_content = clean_text(text_content)
 
         # Extract metadata if not provided
         if not title or not author or not isbn:
             # Try EPUB metadata first if available
             if extraction_file.suffix.lower() == ".epub":
-                epub_metadata = BookParser.extract_epub_metadata(extraction_file)
+                epub_metadata = BookParser.extract_epub_metadata(extraction_file, book=epub_book)
                 if not title and epub_metadata.get("title"):
                     title = epub_metadata["title"]
                 if not author and epub_metadata.get("author"):
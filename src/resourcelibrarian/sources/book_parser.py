@@ -5,9 +5,36 @@ from pathlib import Path
 
 import ebooklib
 import fitz  # PyMuPDF
-from bs4 import BeautifulSoup
 from ebooklib import epub
 
+from resourcelibrarian.sources.html_markdown import html_to_markdown
+
+# Lowercased file extension -> format name
+_FORMAT_BY_SUFFIX = {
+    ".pdf": "pdf",
+    ".epub": "epub",
+    ".md": "markdown",
+    ".markdown": "markdown",
+}
+
+# Parser method for each detected format, looked up on the class so overrides apply
+_PARSER_BY_FORMAT = {
+    "pdf": "parse_pdf",
+    "epub": "parse_epub",
+    "markdown": "parse_markdown",
+}
+
+_EXCESS_BLANK_LINES = re.compile(r"\n{3,}")
+_AUTHOR_PATTERN = re.compile(r"(?:by|author:?)\s+([A-Z][a-zA-Z\s.]+)", re.IGNORECASE)
+# Common front matter that is never the title, e.g. "Praise for", "Dedication"
+_FRONT_MATTER_PATTERN = re.compile(
+    r"^(?:praise\s+for|dedication|copyright|table\s+of\s+contents|contents|foreword|preface"
+    r"|acknowledgments)",
+    re.IGNORECASE,
+)
+_HEADER_PREFIX = re.compile(r"^#+\s*")
+_CAPITAL_LETTER = re.compile(r"[A-Z]")
+
 
 class BookParser:
     """Parser for extracting text from various book formats."""
@@ -33,16 +60,18 @@ class BookParser:
         return "\n\n".join(text_parts)
 
     @staticmethod
-    def parse_epub(file_path: Path) -> str:
+    def parse_epub(file_path: Path, book: epub.EpubBook | None = None) -> str:
         """Extract text from an EPUB file.
 
         Args:
             file_path: Path to EPUB file
+            book: Already-read EPUB for file_path, to avoid parsing the file again
 
         Returns:
             Extracted text content
         """
-        book = epub.read_epub(file_path)
+        if book is None:
+            book = epub.read_epub(file_path)
         text_parts = []
 
         for item in book.get_items():
@@ -66,93 +95,23 @@ class BookParser:
         Returns:
             Markdown text with preserved headings and structure
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Process the HTML tree recursively
-        def process_element(element) -> str:
-            """Recursively process HTML elements to markdown."""
-            if isinstance(element, str):
-                return element.strip()
-
-            # Handle headings
-            if element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                level = int(element.name[1])
-                text = element.get_text().strip()
-                return f"\n\n{'#' * level} {text}\n\n"
-
-            # Handle paragraphs
-            elif element.name == "p":
-                text = "".join(
-                    str(child) if isinstance(child, str) else process_element(child)
-                    for child in element.children
-                )
-                return f"\n\n{text.strip()}\n\n"
-
-            # Handle bold/strong
-            elif element.name in ["b", "strong"]:
-                text = "".join(
-                    str(child) if isinstance(child, str) else process_element(child)
-                    for child in element.children
-                )
-                return f"**{text}**"
-
-            # Handle italic/em
-            elif element.name in ["i", "em"]:
-                text = "".join(
-                    str(child) if isinstance(child, str) else process_element(child)
-                    for child in element.children
-                )
-                return f"*{text}*"
-
-            # Handle line breaks
-            elif element.name == "br":
-                return "\n"
-
-            # Handle divs and other containers - process children
-            elif element.name in ["div", "section", "article", "body", "html"]:
-                return "".join(
-                    str(child) if isinstance(child, str) else process_element(child)
-                    for child in element.children
-                )
-
-            # For other elements, just process children
-            else:
-                if hasattr(element, "children"):
-                    return "".join(
-                        str(child) if isinstance(child, str) else process_element(child)
-                        for child in element.children
-                    )
-                else:
-                    return element.get_text()
-
-        # Process the entire document
-        body = soup.find("body")
-        if body:
-            markdown = process_element(body)
-        else:
-            markdown = process_element(soup)
-
-        # Clean up excessive whitespace
-        markdown = re.sub(r"\n{4,}", "\n\n\n", markdown)
-        markdown = re.sub(r" +", " ", markdown)
-
-        return markdown.strip()
+        return html_to_markdown(html_content)
 
     @staticmethod
-    def extract_epub_metadata(file_path: Path) -> dict[str, str | None]:
+    def extract_epub_metadata(
+        file_path: Path, book: epub.EpubBook | None = None
+    ) -> dict[str, str | None]:
         """Extract metadata from EPUB file.
 
         Args:
             file_path: Path to EPUB file
+            book: Already-read EPUB for file_path, to avoid parsing the file again
 
         Returns:
             Dictionary with title, author, publisher, language, isbn
         """
-        book = epub.read_epub(file_path)
+        if book is None:
+            book = epub.read_epub(file_path)
         metadata = {
             "title": None,
             "author": None,
@@ -216,14 +175,7 @@ class BookParser:
         Returns:
             Format string ('pdf', 'epub', 'markdown') or None if unsupported
         """
-        ext = file_path.suffix.lower()
-        if ext == ".pdf":
-            return "pdf"
-        elif ext == ".epub":
-            return "epub"
-        elif ext in [".md", ".markdown"]:
-            return "markdown"
-        return None
+        return _FORMAT_BY_SUFFIX.get(file_path.suffix.lower())
 
     @classmethod
     def parse(cls, file_path: Path) -> str:
@@ -238,16 +190,10 @@ class BookParser:
         Raises:
             ValueError: If format is unsupported
         """
-        format_type = cls.detect_format(file_path)
-
-        if format_type == "pdf":
-            return cls.parse_pdf(file_path)
-        elif format_type == "epub":
-            return cls.parse_epub(file_path)
-        elif format_type == "markdown":
-            return cls.parse_markdown(file_path)
-        else:
+        parser_name = _PARSER_BY_FORMAT.get(cls.detect_format(file_path))
+        if parser_name is None:
             raise ValueError(f"Unsupported book format: {file_path.suffix}")
+        return getattr(cls, parser_name)(file_path)
 
 
 def clean_text(text: str) -> str:
@@ -260,7 +206,7 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove excessive blank lines (more than 2 in a row)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _EXCESS_BLANK_LINES.sub("\n\n", text)
 
     # Remove leading/trailing whitespace from each line
     lines = [line.strip() for line in text.split("\n")]
@@ -278,7 +224,8 @@ def extract_metadata_from_text(text: str) -> dict[str, str | None]:
     Returns:
         Dictionary with potential title and author
     """
-    lines = text.split("\n")[:20]  # Look at first 20 lines
+    # Look at first 20 lines; maxsplit avoids splitting the rest of the book
+    lines = text.split("\n", 20)[:20]
 
     metadata = {"title": None, "author": None}
 
@@ -288,30 +235,17 @@ def extract_metadata_from_text(text: str) -> dict[str, str | None]:
             continue
 
         # Look for author patterns
-        author_match = re.search(r"(?:by|author:?)\s+([A-Z][a-zA-Z\s.]+)", line, re.IGNORECASE)
+        author_match = _AUTHOR_PATTERN.search(line)
         if author_match and not metadata["author"]:
             metadata["author"] = author_match.group(1).strip()
 
-        # First substantial line might be the title (strip markdown headers)
-        # Skip common front matter like "Praise for", "Dedication", etc.
-        skip_patterns = [
-            r"^praise\s+for",
-            r"^dedication",
-            r"^copyright",
-            r"^table\s+of\s+contents",
-            r"^contents",
-            r"^foreword",
-            r"^preface",
-            r"^acknowledgments",
-        ]
-
-        should_skip = any(re.match(pattern, line, re.IGNORECASE) for pattern in skip_patterns)
-
-        if not metadata["title"] and not should_skip and len(line) > 5 and len(line) < 100:
+        # First substantial line might be the title (strip markdown headers),
+        # skipping common front matter
+        if not metadata["title"] and 5 < len(line) < 100 and not _FRONT_MATTER_PATTERN.match(line):
             # Remove markdown header symbols
-            title = re.sub(r"^#+\s*", "", line)
+            title = _HEADER_PREFIX.sub("", line)
             # Only use if it looks like a title (has capital letters)
-            if re.search(r"[A-Z]", title):
+            if _CAPITAL_LETTER.search(title):
                 metadata["title"] = title
 
     return metadata
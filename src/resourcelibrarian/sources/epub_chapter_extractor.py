@@ -4,9 +4,10 @@ import re
 from pathlib import Path
 
 import ebooklib
-from bs4 import BeautifulSoup
 from ebooklib import epub
 
+from resourcelibrarian.sources.html_markdown import html_to_markdown
+
 
 class EpubChapterExtractor:
     """Extract chapters from EPUB based on internal structure."""
@@ -118,70 +119,7 @@ class EpubChapterExtractor:
         Returns:
             Markdown text
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Process the HTML tree recursively
-        def process_element(element) -> str:
-            """Recursively process HTML elements to markdown."""
-            if isinstance(element, str):
-                text = str(element).strip()
-                return text if text else ""
-
-            if not hasattr(element, "name"):
-                return ""
-
-            # Handle headings
-            if element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-                level = int(element.name[1])
-                text = element.get_text().strip()
-                return f"\n\n{'#' * level} {text}\n\n"
-
-            # Handle paragraphs
-            elif element.name == "p":
-                text = "".join(process_element(child) for child in element.children)
-                return f"\n\n{text.strip()}\n\n"
-
-            # Handle bold/strong
-            elif element.name in ["b", "strong"]:
-                text = "".join(process_element(child) for child in element.children)
-                return f"**{text}**"
-
-            # Handle italic/em
-            elif element.name in ["i", "em"]:
-                text = "".join(process_element(child) for child in element.children)
-                return f"*{text}*"
-
-            # Handle line breaks
-            elif element.name == "br":
-                return "\n"
-
-            # Handle divs and other containers
-            elif element.name in ["div", "section", "article", "body", "html"]:
-                return "".join(process_element(child) for child in element.children)
-
-            # For other elements, process children
-            else:
-                if hasattr(element, "children"):
-                    return "".join(process_element(child) for child in element.children)
-                else:
-                    return element.get_text()
-
-        # Process the document
-        body = soup.find("body")
-        if body:
-            markdown = process_element(body)
-        else:
-            markdown = process_element(soup)
-
-        # Clean up excessive whitespace
-        markdown = re.sub(r"\n{4,}", "\n\n\n", markdown)
-        markdown = re.sub(r" +", " ", markdown)
-
-        return markdown.strip()
+        return html_to_markdown(html_content)
 
     def save_chapters(self, output_dir: Path) -> list[tuple[int, str, Path]]:
         """Extract and save chapters to individual files.
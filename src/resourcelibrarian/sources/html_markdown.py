@@ -0,0 +1,112 @@
+"""HTML-to-markdown conversion shared by the EPUB text and chapter extractors."""
+
+import re
+
+from bs4 import BeautifulSoup
+
+_SCRIPT_OR_STYLE_TAG = re.compile(rb"<(?:script|style)", re.IGNORECASE)
+_SCRIPT_OR_STYLE_TEXT = re.compile(r"<(?:script|style)", re.IGNORECASE)
+_EXCESS_BLANK_LINES = re.compile(r"\n{4,}")
+_REPEATED_SPACES = re.compile(r" +")
+
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+_BOLD_TAGS = frozenset({"b", "strong"})
+_ITALIC_TAGS = frozenset({"i", "em"})
+
+
+def may_have_script_or_style(html_content: bytes | str) -> bool:
+    """Cheaply check whether HTML could contain script or style elements.
+
+    Raw bytes are only searched when they hold ASCII-compatible text. UTF-16 and
+    UTF-32 markup (which EPUB allows) contains NUL bytes, so ASCII "<script" never
+    appears in it and the caller must walk the parsed tree instead.
+
+    Args:
+        html_content: HTML content as bytes or text
+
+    Returns:
+        False only if the content certainly has no script or style tags
+    """
+    if isinstance(html_content, str):
+        return _SCRIPT_OR_STYLE_TEXT.search(html_content) is not None
+    if b"\x00" in html_content:
+        return True
+    return _SCRIPT_OR_STYLE_TAG.search(html_content) is not None
+
+
+def _children_to_markdown(element) -> str:
+    """Join an element's children, keeping text nodes verbatim."""
+    return "".join(
+        str(child) if isinstance(child, str) else element_to_markdown(child)
+        for child in element.children
+    )
+
+
+def element_to_markdown(element) -> str:
+    """Recursively convert a BeautifulSoup element to markdown.
+
+    Args:
+        element: BeautifulSoup tag or text node
+
+    Returns:
+        Markdown for the element, with headings, paragraphs, bold and italic kept
+    """
+    if isinstance(element, str):
+        return element.strip()
+
+    name = element.name
+
+    # Handle headings
+    if name in _HEADING_TAGS:
+        level = int(name[1])
+        text = element.get_text().strip()
+        return f"\n\n{'#' * level} {text}\n\n"
+
+    # Handle paragraphs
+    elif name == "p":
+        return f"\n\n{_children_to_markdown(element).strip()}\n\n"
+
+    # Handle bold/strong
+    elif name in _BOLD_TAGS:
+        return f"**{_children_to_markdown(element)}**"
+
+    # Handle italic/em
+    elif name in _ITALIC_TAGS:
+        return f"*{_children_to_markdown(element)}*"
+
+    # Handle line breaks
+    elif name == "br":
+        return "\n"
+
+    # Divs, other containers and any other element: process children
+    elif hasattr(element, "children"):
+        return _children_to_markdown(element)
+    else:
+        return element.get_text()
+
+
+def html_to_markdown(html_content: bytes) -> str:
+    """Convert HTML content to markdown, preserving structure.
+
+    Args:
+        html_content: HTML content as bytes
+
+    Returns:
+        Markdown text with preserved headings and structure
+    """
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    # Remove script and style elements, skipping the tree walk when there are none
+    if may_have_script_or_style(html_content):
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+    # Process the entire document
+    body = soup.find("body")
+    markdown = element_to_markdown(body if body else soup)
+
+    # Clean up excessive whitespace
+    markdown = _EXCESS_BLANK_LINES.sub("\n\n\n", markdown)
+    markdown = _REPEATED_SPACES.sub(" ", markdown)
+
+    return markdown.strip()
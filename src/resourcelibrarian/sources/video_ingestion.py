@@ -1,32 +1,30 @@
 """Video ingestion - add YouTube videos to the resource library."""
 
+import functools
 import re
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from resourcelibrarian.models import Video, VideoManifest
 from resourcelibrarian.utils.io import save_video_manifest
+from resourcelibrarian.utils.slug import slugify
 from resourcelibrarian.sources.youtube_api import YouTubeAPI
 from resourcelibrarian.sources.youtube_transcript import (
     TranscriptNotAvailableError,
     YouTubeTranscript,
 )
 
-
-def slugify(text: str) -> str:
-    """Convert text to a URL-safe slug.
-
-    Args:
-        text: Text to slugify
-
-    Returns:
-        Slugified text
-    """
-    text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
-    return text.strip("-")
+# YouTube URL formats, compiled once at import
+_VIDEO_URL_PATTERNS = (
+    re.compile(
+        r"(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/(?:embed|shorts)\/)"
+        r"([a-zA-Z0-9_-]{11})"
+    ),
+    re.compile(r"youtube\.com\/.*[?&]v=([a-zA-Z0-9_-]{11})"),
+)
+_VIDEO_ID_PATTERN = re.compile(r"\A[a-zA-Z0-9_-]{11}\Z")
 
 
 def extract_video_id(url_or_id: str) -> str | None:
@@ -38,21 +36,17 @@ def extract_video_id(url_or_id: str) -> str | None:
     Returns:
         Video ID or None if not found
     """
-    # Handle different YouTube URL formats
-    patterns = [
-        r"(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([a-zA-Z0-9_-]{11})",
-        r"youtube\.com\/.*[?&]v=([a-zA-Z0-9_-]{11})",
-    ]
+    # If it's already just a video ID. Checked first: it is the common case, and an
+    # ID can't contain the "." or "/" that every URL pattern requires.
+    if len(url_or_id) == 11 and _VIDEO_ID_PATTERN.match(url_or_id):
+        return url_or_id
 
-    for pattern in patterns:
-        match = re.search(pattern, url_or_id)
+    # Handle different YouTube URL formats
+    for pattern in _VIDEO_URL_PATTERNS:
+        match = pattern.search(url_or_id)
         if match:
             return match.group(1)
 
-    # If it's already just a video ID
-    if re.match(r"^[a-zA-Z0-9_-]{11}$", url_or_id):
-        return url_or_id
-
     return None
 
 
@@ -73,6 +67,8 @@ def create_video_folder_name(video_id: str, title: str) -> str:
     return f"{video_id}__{title_slug}"
 
 
+# Every video of a channel maps to the same folder name, so batches hit this cache
+@functools.lru_cache(maxsize=256)
 def create_channel_folder_name(channel_id: str, channel_title: str) -> str:
     """Create folder name for a channel.
 
@@ -90,6 +86,28 @@ def create_channel_folder_name(channel_id: str, channel_title: str) -> str:
     return f"{channel_slug}__{channel_id}"
 
 
+def _required_video_fields(video_metadata: dict) -> tuple[str, str, str, str]:
+    """Extract the fields every video needs from MCP YouTube metadata.
+
+    Args:
+        video_metadata: Video metadata, with camelCase or snake_case keys
+
+    Returns:
+        (video_id, title, channel_id, channel_title)
+
+    Raises:
+        ValueError: If any of the fields is missing or empty
+    """
+    video_id = video_metadata.get("videoId") or video_metadata.get("video_id")
+    title = video_metadata.get("title")
+    channel_id = video_metadata.get("channelId") or video_metadata.get("channel_id")
+    channel_title = video_metadata.get("channelTitle") or video_metadata.get("channel_title")
+
+    if not all([video_id, title, channel_id, channel_title]):
+        raise ValueError("Missing required video metadata fields")
+    return video_id, title, channel_id, channel_title
+
+
 class VideoIngestion:
     """Handle YouTube video ingestion into the resource library."""
 
@@ -102,6 +120,30 @@ class VideoIngestion:
         self.library_path = Path(library_path)
         self.videos_dir = self.library_path / "videos"
 
+    @staticmethod
+    def _write_source_files(video_folder: Path, video_id: str, transcript_text: str) -> str:
+        """Create a new video folder and write its transcript and URL files.
+
+        Args:
+            video_folder: Video folder to create
+            video_id: YouTube video ID
+            transcript_text: Video transcript text
+
+        Returns:
+            Watch URL of the video
+        """
+        # Creating source/ with parents also creates the video and channel folders
+        source_dir = video_folder / "source"
+        source_dir.mkdir(parents=True, exist_ok=True)
+        (video_folder / "summaries").mkdir(exist_ok=True)
+        (video_folder / "pointers").mkdir(exist_ok=True)
+
+        (source_dir / "transcript.txt").write_text(transcript_text, encoding="utf-8")
+
+        url = f"https://www.youtube.com/watch?v={video_id}"
+        (source_dir / "video.url").write_text(url, encoding="utf-8")
+        return url
+
     def add_single_video(
         self,
         video_id_or_url: str,
@@ -155,20 +197,7 @@ class VideoIngestion:
                 f"Video folder already exists: {channel_folder_name}/{video_folder_name}"
             )
 
-        # Create directories
-        video_folder.mkdir(parents=True, exist_ok=True)
-        (video_folder / "source").mkdir(exist_ok=True)
-        (video_folder / "summaries").mkdir(exist_ok=True)
-        (video_folder / "pointers").mkdir(exist_ok=True)
-
-        # Save transcript
-        transcript_path = video_folder / "source" / "transcript.txt"
-        transcript_path.write_text(transcript_text, encoding="utf-8")
-
-        # Save video URL
-        url = f"https://www.youtube.com/watch?v={video_id}"
-        url_path = video_folder / "source" / "video.url"
-        url_path.write_text(url, encoding="utf-8")
+        url = self._write_source_files(video_folder, video_id, transcript_text)
 
         # Parse publishedAt if present
         published_at = None
@@ -176,8 +205,8 @@ class VideoIngestion:
             published_str = video_metadata.get("publishedAt")
             if published_str:
                 try:
-                    published_at = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
+                    published_at = datetime.fromisoformat(published_str)
+                except (ValueError, TypeError):
                     pass
 
         # Create manifest
@@ -232,77 +261,91 @@ class VideoIngestion:
         Raises:
             ValueError: If video already exists or required fields missing
         """
-        # Extract required fields from metadata
-        video_id = video_metadata.get("videoId") or video_metadata.get("video_id")
-        title = video_metadata.get("title")
-        channel_id = video_metadata.get("channelId") or video_metadata.get("channel_id")
-        channel_title = video_metadata.get("channelTitle") or video_metadata.get("channel_title")
-
-        if not all([video_id, title, channel_id, channel_title]):
-            raise ValueError("Missing required video metadata fields")
-
-        # Create folder structure
-        channel_folder_name = create_channel_folder_name(channel_id, channel_title)
-        video_folder_name = create_video_folder_name(video_id, title)
-
-        channel_folder = self.videos_dir / channel_folder_name
-        video_folder = channel_folder / video_folder_name
-
-        if video_folder.exists():
-            raise ValueError(f"Video already exists: {channel_folder_name}/{video_folder_name}")
+        return self.add_videos([(video_metadata, transcript_text)], categories, tags)[0]
 
-        # Create directories
-        video_folder.mkdir(parents=True, exist_ok=True)
-        (video_folder / "source").mkdir(exist_ok=True)
-        (video_folder / "summaries").mkdir(exist_ok=True)
-        (video_folder / "pointers").mkdir(exist_ok=True)
+    def add_videos(
+        self,
+        entries: Iterable[tuple[dict, str]],
+        categories: list[str] | None = None,
+        tags: list[str] | None = None,
+    ) -> list[Video]:
+        """Add several videos to the library.
 
-        # Save transcript
-        transcript_path = video_folder / "source" / "transcript.txt"
-        transcript_path.write_text(transcript_text, encoding="utf-8")
+        Every entry is checked before anything is written, so a duplicate or
+        incomplete entry fails the batch with nothing on disk. An I/O error while
+        writing still leaves the videos written before it in place; the catalog is
+        not updated here either way.
 
-        # Save video URL
-        url = f"https://www.youtube.com/watch?v={video_id}"
-        url_path = video_folder / "source" / "video.url"
-        url_path.write_text(url, encoding="utf-8")
+        Args:
+            entries: (video metadata, transcript text) pairs, e.g. a channel's uploads
+            categories: User-defined categories applied to every video
+            tags: Additional tags applied to every video
 
-        # Parse publishedAt if present
-        published_at = None
-        if "publishedAt" in video_metadata or "published_at" in video_metadata:
-            published_str = video_metadata.get("publishedAt") or video_metadata.get("published_at")
-            if published_str:
-                try:
-                    published_at = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
-                    pass
+        Returns:
+            Video instances, in the order of the entries
 
-        # Create manifest
-        manifest = VideoManifest(
-            videoId=video_id,
-            title=title,
-            description=video_metadata.get("description", ""),
-            url=url,
-            thumbnails=video_metadata.get("thumbnails", {}),
-            channelId=channel_id,
-            channelTitle=channel_title,
-            tags=video_metadata.get("tags", []) + (tags or []),
-            categories=categories or [],
-            categoryId=video_metadata.get("categoryId"),
-            publishedAt=published_at,
-            defaultLanguage=video_metadata.get("defaultLanguage"),
-            defaultAudioLanguage=video_metadata.get("defaultAudioLanguage"),
-            source={
-                "transcript_path": "source/transcript.txt",
-                "url_file": "source/video.url",
-            },
-            summaries={},
-            pointers={},
-        )
+        Raises:
+            ValueError: If a video already exists, appears twice, or misses required fields
+        """
+        planned = []
+        planned_folders = set()
+        for video_metadata, transcript_text in entries:
+            fields = _required_video_fields(video_metadata)
+            video_id, title, channel_id, channel_title = fields
+
+            # Create folder structure
+            channel_folder_name = create_channel_folder_name(channel_id, channel_title)
+            video_folder_name = create_video_folder_name(video_id, title)
+            video_folder = self.videos_dir / channel_folder_name / video_folder_name
+
+            if video_folder in planned_folders or video_folder.exists():
+                raise ValueError(f"Video already exists: {channel_folder_name}/{video_folder_name}")
+            planned_folders.add(video_folder)
+            planned.append((video_folder, video_metadata, transcript_text, fields))
+
+        videos = []
+        for video_folder, video_metadata, transcript_text, fields in planned:
+            video_id, title, channel_id, channel_title = fields
+            url = self._write_source_files(video_folder, video_id, transcript_text)
+
+            # Parse publishedAt if present
+            published_at = None
+            if "publishedAt" in video_metadata or "published_at" in video_metadata:
+                published_str = video_metadata.get("publishedAt") or video_metadata.get(
+                    "published_at"
+                )
+                if published_str:
+                    try:
+                        published_at = datetime.fromisoformat(published_str)
+                    except (ValueError, TypeError):
+                        pass
+
+            # Create manifest
+            manifest = VideoManifest(
+                videoId=video_id,
+                title=title,
+                description=video_metadata.get("description", ""),
+                url=url,
+                thumbnails=video_metadata.get("thumbnails", {}),
+                channelId=channel_id,
+                channelTitle=channel_title,
+                tags=video_metadata.get("tags", []) + (tags or []),
+                categories=categories or [],
+                categoryId=video_metadata.get("categoryId"),
+                publishedAt=published_at,
+                defaultLanguage=video_metadata.get("defaultLanguage"),
+                defaultAudioLanguage=video_metadata.get("defaultAudioLanguage"),
+                source={
+                    "transcript_path": "source/transcript.txt",
+                    "url_file": "source/video.url",
+                },
+                summaries={},
+                pointers={},
+            )
 
-        # Save manifest
-        save_video_manifest(manifest, video_folder)
+            # Save manifest
+            save_video_manifest(manifest, video_folder)
 
-        # Create Video instance
-        video = Video(folder_path=video_folder, manifest=manifest)
+            videos.append(Video(folder_path=video_folder, manifest=manifest))
 
-        return video
+        return videos
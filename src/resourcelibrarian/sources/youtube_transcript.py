@@ -2,7 +2,7 @@
 
 from typing import Optional, Tuple
 
-from youtube_transcript_api import YouTubeTranscriptApi
+from youtube_transcript_api import NoTranscriptFound, YouTubeTranscriptApi
 
 
 class TranscriptNotAvailableError(Exception):
@@ -14,8 +14,22 @@ class TranscriptNotAvailableError(Exception):
 class YouTubeTranscript:
     """YouTube transcript fetcher (no API key needed)."""
 
-    @staticmethod
-    def fetch_transcript(video_id: str, language: str = "en") -> Tuple[str, Optional[str]]:
+    # Shared API client so repeated fetches reuse its HTTP session (keep-alive)
+    _api: Optional[YouTubeTranscriptApi] = None
+
+    @classmethod
+    def _get_api(cls) -> YouTubeTranscriptApi:
+        """Get the shared transcript API client, creating it on first use.
+
+        Returns:
+            YouTubeTranscriptApi instance
+        """
+        if cls._api is None:
+            cls._api = YouTubeTranscriptApi()
+        return cls._api
+
+    @classmethod
+    def fetch_transcript(cls, video_id: str, language: str = "en") -> Tuple[str, Optional[str]]:
         """Fetch transcript for a YouTube video.
 
         Args:
@@ -29,50 +43,29 @@ class YouTubeTranscript:
             TranscriptNotAvailableError: If no transcript available
         """
         try:
-            # Initialize the API
-            api = YouTubeTranscriptApi()
+            transcript_list = cls._get_api().list(video_id)
 
-            # Try requested language first
-            transcript_list = api.list(video_id)
-
-            # Try to find requested language
-            try:
-                transcript = transcript_list.find_transcript([language])
-                transcript_data = transcript.fetch()
-                text = YouTubeTranscript._format_transcript(transcript_data)
-                return text, language
-            except Exception:
-                pass
-
-            # Try English as fallback
-            if language != "en":
-                try:
-                    transcript = transcript_list.find_transcript(["en"])
-                    transcript_data = transcript.fetch()
-                    text = YouTubeTranscript._format_transcript(transcript_data)
-                    return text, "en"
-                except Exception:
-                    pass
-
-            # Try any available transcript (including generated)
+            # Requested language first, English as fallback (deduplicated, order kept).
+            # find_transcript prefers manually created transcripts and falls back to
+            # generated ones, so a single lookup covers every preferred language.
+            languages = list(dict.fromkeys([language, "en"]))
             try:
-                transcript = transcript_list.find_generated_transcript(["en"])
-                transcript_data = transcript.fetch()
-                text = YouTubeTranscript._format_transcript(transcript_data)
-                return text, "en (generated)"
-            except Exception:
-                pass
-
-            # Last resort: get first available
-            for transcript in transcript_list:
-                try:
-                    transcript_data = transcript.fetch()
-                    text = YouTubeTranscript._format_transcript(transcript_data)
-                    return text, transcript.language_code
-                except Exception:
-                    continue
-
-            raise TranscriptNotAvailableError(f"No transcript available for video {video_id}")
+                transcript = transcript_list.find_transcript(languages)
+            except NoTranscriptFound:
+                # Last resort: the first available transcript in any language
+                transcript = next(iter(transcript_list), None)
+                if transcript is None:
+                    raise TranscriptNotAvailableError(
+                        f"No transcript available for video {video_id}"
+                    )
+
+            # Only a missing language falls through to another choice; blocked
+            # requests, disabled transcripts and network errors propagate at once
+            transcript_data = transcript.fetch()
+            text = cls._format_transcript(transcript_data)
+            # Report the code alone, manual or generated: the requested code, "en", or
+            # the last-resort transcript's code, matching the labels callers always got
+            return text, transcript.language_code
 
         except Exception as e:
             if isinstance(e, TranscriptNotAvailableError):
@@ -89,11 +82,9 @@ class YouTubeTranscript:
         Returns:
             Formatted transcript text
         """
-        text_parts = []
-        for entry in transcript_data:
-            # Handle both dict and object formats
-            if hasattr(entry, "text"):
-                text_parts.append(entry.text.strip())
-            elif isinstance(entry, dict) and "text" in entry:
-                text_parts.append(entry["text"].strip())
-        return " ".join(text_parts)
+        # Handle both object and dict formats, streaming straight into join
+        texts = (
+            getattr(entry, "text", None) or (entry.get("text") if isinstance(entry, dict) else None)
+            for entry in transcript_data
+        )
+        return " ".join(text.strip() for text in texts if text)
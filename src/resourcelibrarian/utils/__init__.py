@@ -3,10 +3,12 @@
 This module provides:
 - I/O operations for YAML and JSON files
 - Content hashing for file integrity
+- Slug generation for folder names
 """
 
 from resourcelibrarian.utils.hash import (
     compute_file_hash,
+    compute_file_hashes,
     compute_text_hash,
     short_hash,
 )
@@ -20,6 +22,7 @@ from resourcelibrarian.utils.io import (
     save_video_manifest,
     save_yaml,
 )
+from resourcelibrarian.utils.slug import slugify
 
 __all__ = [
     # I/O functions
@@ -34,5 +37,8 @@ __all__ = [
     # Hash functions
     "compute_text_hash",
     "compute_file_hash",
+    "compute_file_hashes",
     "short_hash",
+    # Slug functions
+    "slugify",
 ]
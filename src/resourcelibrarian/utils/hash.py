@@ -1,14 +1,26 @@
 """Hashing utilities for content integrity and file tracking."""
 
 import hashlib
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def compute_text_hash(text: str, algorithm: str = "sha256") -> str:
+# Direct constructors for common algorithms, skipping hashlib.new() name dispatch
+_HASH_CONSTRUCTORS = {
+    "sha256": hashlib.sha256,
+    "sha1": hashlib.sha1,
+    "md5": hashlib.md5,
+    "blake2b": hashlib.blake2b,
+}
+
+
+def compute_text_hash(text: str | bytes, algorithm: str = "sha256") -> str:
     """Compute hash of text content.
 
     Args:
-        text: Text to hash
+        text: Text to hash (already UTF-8 encoded bytes are hashed as-is)
         algorithm: Hash algorithm (default: sha256)
 
     Returns:
@@ -18,10 +30,10 @@ def compute_text_hash(text: str, algorithm: str = "sha256") -> str:
         >>> compute_text_hash("Hello, World!")
         'sha256_dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f'
     """
-    hasher = hashlib.new(algorithm)
-    hasher.update(text.encode("utf-8"))
-    digest = hasher.hexdigest()
-    return f"{algorithm}_{digest}"
+    data = text if isinstance(text, bytes) else text.encode("utf-8")
+    constructor = _HASH_CONSTRUCTORS.get(algorithm)
+    hasher = constructor(data) if constructor else hashlib.new(algorithm, data)
+    return f"{algorithm}_{hasher.hexdigest()}"
 
 
 def compute_file_hash(file_path: Path, algorithm: str = "sha256") -> str:
@@ -43,20 +55,50 @@ def compute_file_hash(file_path: Path, algorithm: str = "sha256") -> str:
         >>> compute_file_hash(Path("document.pdf"))
         'sha256_1a2b3c4d5e6f...'
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    hasher = hashlib.new(algorithm)
+    constructor = _HASH_CONSTRUCTORS.get(algorithm, algorithm)
 
-    with open(file_path, "rb") as f:
-        # Read in 8KB chunks for efficient large file processing
-        for chunk in iter(lambda: f.read(8192), b""):
-            hasher.update(chunk)
+    try:
+        # Unbuffered: file_digest reads into its own buffer, so a BufferedReader is only overhead
+        with open(file_path, "rb", buffering=0) as f:
+            # file_digest runs the chunked read loop in C with a reused buffer
+            hasher = hashlib.file_digest(f, constructor)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e
 
     digest = hasher.hexdigest()
     return f"{algorithm}_{digest}"
 
 
+def compute_file_hashes(file_paths: Iterable[Path], algorithm: str = "sha256") -> dict[Path, str]:
+    """Compute hashes of several files concurrently.
+
+    hashlib releases the GIL while digesting, so a small thread pool overlaps
+    reading and hashing across files and cores.
+
+    Args:
+        file_paths: Paths to files
+        algorithm: Hash algorithm (default: sha256)
+
+    Returns:
+        Mapping of each path to its hash, in the order the paths were given
+
+    Raises:
+        FileNotFoundError: If any file doesn't exist
+
+    Example:
+        >>> compute_file_hashes([Path("a.pdf"), Path("b.epub")])
+        {PosixPath('a.pdf'): 'sha256_1a2b...', PosixPath('b.epub'): 'sha256_3c4d...'}
+    """
+    file_paths = list(file_paths)
+    if not file_paths:
+        return {}
+
+    max_workers = min(8, os.cpu_count() or 1, len(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        hashes = executor.map(lambda path: compute_file_hash(path, algorithm), file_paths)
+        return dict(zip(file_paths, hashes))
+
+
 def short_hash(hash_string: str, length: int = 12) -> str:
     """Get shortened version of a hash for display purposes.
 
@@ -71,7 +113,8 @@ def short_hash(hash_string: str, length: int = 12) -> str:
         >>> short_hash('sha256_1a2b3c4d5e6f7890abcdef', 8)
         'sha256_1a2b3c4d'
     """
-    if "_" in hash_string:
-        algo, digest = hash_string.split("_", 1)
-        return f"{algo}_{digest[:length]}"
-    return hash_string[:length]
+    # Slice once around the prefix separator instead of splitting and re-joining
+    separator = hash_string.find("_")
+    if separator < 0:
+        return hash_string[:length]
+    return hash_string[: separator + 1 + length]
@@ -1,12 +1,81 @@
 """I/O utilities for loading and saving manifests and catalog data."""
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Prefer the libyaml C loader and emitter; fall back to pure Python if PyYAML was built
+# without them.
+try:
+    from yaml import CSafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+    CSafeDumper = None
+
 from resourcelibrarian.models import BookManifest, VideoManifest
+from resourcelibrarian.utils.manifest_cache import (
+    invalidate_cached_manifest,
+    load_cached_manifest,
+    manifest_signature,
+    store_cached_manifest,
+)
+
+_YAML_DUMP_OPTIONS = {
+    "default_flow_style": False,
+    "sort_keys": False,
+    "allow_unicode": True,
+    "encoding": "utf-8",
+}
+
+
+def _atomic_write_bytes(data: bytes, file_path: Path) -> None:
+    """Write bytes to a file atomically.
+
+    The content is written to a sibling temporary file which then replaces
+    the target, so readers never observe a partially written file.
+
+    Args:
+        data: Encoded content to write
+        file_path: Destination path
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _dump_yaml(data: dict[str, Any]) -> bytes:
+    """Serialize data to UTF-8 YAML, preferring the faster libyaml emitter.
+
+    The Python emitter is used instead in two cases:
+
+    - libyaml's safe representer raises RepresenterError, e.g. for a Path or Enum value.
+    - The output contains a backslash-U. libyaml escapes characters outside the Basic
+      Multilingual Plane (e.g. emoji as "\\U0001F4DA") even with allow_unicode. The
+      check is conservative: a literal backslash-U in the data, such as a Windows path,
+      also takes the slower Python emitter.
+
+    On dicts, lists, ints, None and printable text the two emitters produced the same
+    bytes in randomized checks. They are not byte-identical in general: tuples and
+    some control characters such as U+0085 are written differently.
+    """
+    if CSafeDumper is not None:
+        try:
+            content = yaml.dump(data, Dumper=CSafeDumper, **_YAML_DUMP_OPTIONS)
+        except yaml.representer.RepresenterError:
+            pass
+        else:
+            if b"\\U" not in content:
+                return content
+
+    return yaml.dump(data, **_YAML_DUMP_OPTIONS)
 
 
 def load_yaml(file_path: Path) -> dict[str, Any]:
@@ -22,11 +91,13 @@ def load_yaml(file_path: Path) -> dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         yaml.YAMLError: If YAML parsing fails
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"YAML file not found: {file_path}")
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    # open() already stats the file; translate its error rather than checking first.
+    # The stream is binary so the loader decodes UTF-8 itself instead of via TextIOWrapper.
+    try:
+        with open(file_path, "rb") as f:
+            return yaml.load(f, Loader=SafeLoader)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"YAML file not found: {file_path}") from e
 
 
 def save_yaml(data: dict[str, Any], file_path: Path) -> None:
@@ -37,11 +108,11 @@ def save_yaml(data: dict[str, Any], file_path: Path) -> None:
         file_path: Path to save YAML file
 
     Note:
-        Creates parent directories if they don't exist
+        Creates parent directories if they don't exist.
+        The file is replaced atomically via a temporary sibling file.
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    _atomic_write_bytes(_dump_yaml(data), file_path)
 
 
 def load_json(file_path: Path) -> dict[str, Any]:
@@ -57,11 +128,11 @@ def load_json(file_path: Path) -> dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If JSON parsing fails
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"JSON file not found: {file_path}")
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Read raw bytes; json.loads detects UTF-8 itself, skipping the text-mode wrapper
+    try:
+        return json.loads(file_path.read_bytes())
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"JSON file not found: {file_path}") from e
 
 
 def save_json(data: dict[str, Any], file_path: Path, indent: int = 2) -> None:
@@ -73,11 +144,12 @@ def save_json(data: dict[str, Any], file_path: Path, indent: int = 2) -> None:
         indent: JSON indentation level (default: 2)
 
     Note:
-        Creates parent directories if they don't exist
+        Creates parent directories if they don't exist.
+        The file is replaced atomically via a temporary sibling file.
     """
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    content = json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+    _atomic_write_bytes(content, file_path)
 
 
 def load_book_manifest(folder_path: Path) -> BookManifest:
@@ -95,11 +167,20 @@ def load_book_manifest(folder_path: Path) -> BookManifest:
         pydantic.ValidationError: If manifest data is invalid
     """
     manifest_path = folder_path / "manifest.yaml"
-    if not manifest_path.exists():
-        raise FileNotFoundError(f"No manifest.yaml found in {folder_path}")
-
-    data = load_yaml(manifest_path)
-    return BookManifest(**data)
+    try:
+        # Unchanged manifests are served from the cache, skipping parsing and validation.
+        # The signature is taken before reading so a concurrent edit reads as stale.
+        signature = manifest_signature(manifest_path, BookManifest)
+        manifest = load_cached_manifest(manifest_path, BookManifest, signature)
+        if manifest is not None:
+            return manifest
+        data = load_yaml(manifest_path)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"No manifest.yaml found in {folder_path}") from e
+
+    manifest = BookManifest.model_validate(data)
+    store_cached_manifest(manifest_path, manifest, signature)
+    return manifest
 
 
 def save_book_manifest(manifest: BookManifest, folder_path: Path) -> None:
@@ -115,6 +196,7 @@ def save_book_manifest(manifest: BookManifest, folder_path: Path) -> None:
     """
     manifest_path = folder_path / "manifest.yaml"
     save_yaml(manifest.to_yaml_dict(), manifest_path)
+    invalidate_cached_manifest(manifest_path)
 
 
 def load_video_manifest(folder_path: Path) -> VideoManifest:
@@ -132,11 +214,20 @@ def load_video_manifest(folder_path: Path) -> VideoManifest:
         pydantic.ValidationError: If manifest data is invalid
     """
     manifest_path = folder_path / "manifest.yaml"
-    if not manifest_path.exists():
-        raise FileNotFoundError(f"No manifest.yaml found in {folder_path}")
-
-    data = load_yaml(manifest_path)
-    return VideoManifest(**data)
+    try:
+        # Unchanged manifests are served from the cache, skipping parsing and validation.
+        # The signature is taken before reading so a concurrent edit reads as stale.
+        signature = manifest_signature(manifest_path, VideoManifest)
+        manifest = load_cached_manifest(manifest_path, VideoManifest, signature)
+        if manifest is not None:
+            return manifest
+        data = load_yaml(manifest_path)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"No manifest.yaml found in {folder_path}") from e
+
+    manifest = VideoManifest.model_validate(data)
+    store_cached_manifest(manifest_path, manifest, signature)
+    return manifest
 
 
 def save_video_manifest(manifest: VideoManifest, folder_path: Path) -> None:
@@ -152,3 +243,4 @@ def save_video_manifest(manifest: VideoManifest, folder_path: Path) -> None:
     """
     manifest_path = folder_path / "manifest.yaml"
     save_yaml(manifest.to_yaml_dict(), manifest_path)
+    invalidate_cached_manifest(manifest_path)
@@ -0,0 +1,223 @@
+"""On-disk cache of validated manifests to skip YAML parsing and validation.
+
+Validated manifest models are pickled under the user cache directory, keyed by
+the manifest path. Each entry records the manifest's modification time and size,
+so an edited manifest is transparently re-parsed, and a fingerprint of the installed
+package and pydantic versions and the model fields, so entries written by another
+release are misses too.
+
+The cache is bounded: at most once a day (tracked by the mtime of a stamp file in
+the cache directory), entries older than 30 days are removed and the oldest beyond
+10,000 entries are evicted. It can be cleared at any time by
+deleting the directory returned by get_cache_dir(), or with clear_manifest_cache().
+"""
+
+import functools
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Optional, TypeVar
+
+import pydantic
+from pydantic import BaseModel
+
+from resourcelibrarian import __version__
+
+ManifestT = TypeVar("ManifestT", bound=BaseModel)
+
+_MAX_ENTRIES = 10_000
+_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+_PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+_PRUNE_STAMP = ".last-pruned"
+
+
+def _package_version() -> str:
+    """Get the installed distribution version, falling back to the module version."""
+    try:
+        return importlib.metadata.version("resource-librarian")
+    except importlib.metadata.PackageNotFoundError:
+        return __version__
+
+
+_PACKAGE_VERSION = _package_version()
+
+# Set once this process has checked whether the cache is due for pruning
+_prune_checked = False
+
+
+def get_cache_dir() -> Path:
+    """Get the directory holding cached manifests.
+
+    Returns:
+        $XDG_CACHE_HOME/resourcelibrarian, or ~/.cache/resourcelibrarian
+    """
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "resourcelibrarian"
+
+
+def _cache_file(manifest_path: Path) -> Path:
+    """Get the cache file for a manifest path."""
+    key = hashlib.sha1(str(manifest_path.absolute()).encode("utf-8")).hexdigest()
+    return get_cache_dir() / f"{key}.pkl"
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_fingerprint(manifest_type: type[BaseModel]) -> str:
+    """Fingerprint a manifest model by package and pydantic versions and its fields."""
+    fields = sorted(
+        f"{name}:{field.annotation!r}" for name, field in manifest_type.model_fields.items()
+    )
+    key = "\n".join([_PACKAGE_VERSION, pydantic.VERSION, manifest_type.__qualname__, *fields])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def manifest_signature(manifest_path: Path, manifest_type: type[BaseModel]) -> tuple[int, int, str]:
+    """Get the (mtime_ns, size, schema) signature used to validate cache entries.
+
+    Callers that both look up and store a manifest should compute this once and
+    pass it to load_cached_manifest() and store_cached_manifest(), so a miss costs
+    a single stat.
+
+    Args:
+        manifest_path: Path to the manifest.yaml file
+        manifest_type: Manifest model class
+
+    Returns:
+        Signature tuple
+
+    Raises:
+        FileNotFoundError: If the manifest doesn't exist
+        NotADirectoryError: If a parent of the manifest path is a file
+    """
+    stat = manifest_path.stat()
+    return (stat.st_mtime_ns, stat.st_size, _schema_fingerprint(manifest_type))
+
+
+def _prune_if_due(cache_dir: Path) -> None:
+    """Prune the cache if the stamp file shows it wasn't pruned within the interval.
+
+    Costs one stat per process; the directory scan only runs once per interval.
+    """
+    stamp = cache_dir / _PRUNE_STAMP
+    try:
+        if time.time() - stamp.stat().st_mtime < _PRUNE_INTERVAL_SECONDS:
+            return
+    except FileNotFoundError:
+        pass
+
+    stamp.touch()
+    _prune_cache(cache_dir)
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Remove cache entries past the age limit, then the oldest beyond the size limit."""
+    cutoff = time.time() - _MAX_AGE_SECONDS
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".pkl"):
+                    entries.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return
+
+    entries.sort(reverse=True)
+    for index, (mtime, path) in enumerate(entries):
+        if index >= _MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def load_cached_manifest(
+    manifest_path: Path,
+    manifest_type: type[ManifestT],
+    signature: Optional[tuple[int, int, str]] = None,
+) -> Optional[ManifestT]:
+    """Load a manifest from the cache if it is still current.
+
+    Args:
+        manifest_path: Path to the manifest.yaml file
+        manifest_type: Expected manifest model class
+        signature: Signature from manifest_signature(), computed if not given
+
+    Returns:
+        Cached manifest instance, or None on a miss or stale entry
+
+    Raises:
+        FileNotFoundError: If the manifest doesn't exist
+        NotADirectoryError: If a parent of the manifest path is a file
+    """
+    if signature is None:
+        signature = manifest_signature(manifest_path, manifest_type)
+
+    try:
+        cached_signature, manifest = pickle.loads(_cache_file(manifest_path).read_bytes())
+        if cached_signature != signature or not isinstance(manifest, manifest_type):
+            return None
+    except Exception:
+        # Missing, unreadable or incompatible cache entries are simply misses; unpickling
+        # can raise almost anything (e.g. AttributeError for a class that moved)
+        return None
+    return manifest
+
+
+def store_cached_manifest(
+    manifest_path: Path,
+    manifest: BaseModel,
+    signature: Optional[tuple[int, int, str]] = None,
+) -> None:
+    """Store a validated manifest in the cache.
+
+    Caching is best-effort: failures to write the cache are ignored. The first
+    store in each process also prunes old and excess entries if a prune is due.
+
+    Args:
+        manifest_path: Path to the manifest.yaml file the model was loaded from
+        manifest: Validated manifest instance
+        signature: Signature taken before the manifest was read, computed if not given
+    """
+    global _prune_checked
+
+    try:
+        cache_file = _cache_file(manifest_path)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        if signature is None:
+            signature = manifest_signature(manifest_path, type(manifest))
+        cache_file.write_bytes(pickle.dumps((signature, manifest)))
+        if not _prune_checked:
+            _prune_checked = True
+            _prune_if_due(cache_file.parent)
+    except OSError:
+        pass
+
+
+def invalidate_cached_manifest(manifest_path: Path) -> None:
+    """Remove any cached entry for a manifest.
+
+    Args:
+        manifest_path: Path to the manifest.yaml file
+    """
+    try:
+        _cache_file(manifest_path).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def clear_manifest_cache() -> None:
+    """Remove every cached manifest."""
+    try:
+        with os.scandir(get_cache_dir()) as it:
+            paths = [entry.path for entry in it if entry.name.endswith(".pkl")]
+    except OSError:
+        return
+
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -0,0 +1,52 @@
+"""Slug generation for resource folder names."""
+
+import re
+
+# Slug patterns, compiled once at import
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS = re.compile(r"[-\s]+")
+
+
+def _build_slug_table() -> tuple[bytes, bytes]:
+    """Build the ASCII byte translation used by slugify's fast path.
+
+    The table lowercases and turns separators into "-", and the delete set holds
+    everything the slug patterns would strip, so one bytes.translate pass does the
+    work of both substitutions.
+
+    Returns:
+        (256-byte translation table, bytes to delete)
+    """
+    table = bytearray(range(256))
+    delete = bytearray()
+    for code in range(128):
+        char = chr(code).lower()
+        if _SLUG_SEPARATORS.match(char):
+            table[code] = ord("-")
+        elif _SLUG_STRIP.match(char):
+            delete.append(code)
+        else:
+            table[code] = ord(char)
+    return bytes(table), bytes(delete)
+
+
+_SLUG_TABLE, _SLUG_DELETE = _build_slug_table()
+
+
+def slugify(text: str) -> str:
+    """Convert text to a URL-safe slug.
+
+    Args:
+        text: Text to slugify
+
+    Returns:
+        Slugified text
+    """
+    if text.isascii():
+        slug = text.encode("ascii").translate(_SLUG_TABLE, _SLUG_DELETE).decode("ascii")
+        return "-".join(part for part in slug.split("-") if part)
+
+    text = text.lower()
+    text = _SLUG_STRIP.sub("", text)
+    text = _SLUG_SEPARATORS.sub("-", text)
+    return text.strip("-")
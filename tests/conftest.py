@@ -0,0 +1,250 @@
+"""Shared pytest fixtures for Resource Librarian tests."""
+
+import contextlib
+import inspect
+import io
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from unittest.mock import create_autospec
+
+import pytest
+import typer
+from typer.models import ParameterInfo
+
+SHM_DIR = Path("/dev/shm")
+
+FROZEN_NOW = datetime(2024, 1, 1)
+
+
+def _filesystem_type(path: Path) -> Optional[str]:
+    """Get the filesystem type of the mount holding a path, from /proc/mounts."""
+    try:
+        mounts = Path("/proc/mounts").read_text().splitlines()
+    except OSError:
+        return None
+
+    best_mount, best_type = "", None
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        mount_point, fs_type = fields[1], fields[2]
+        if path.is_relative_to(mount_point) and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fs_type
+    return best_type
+
+
+def pytest_configure(config):
+    """Put test temp directories on tmpfs when the default temp dir is on disk.
+
+    Tests create many small files (every library init writes a catalog and
+    index markdown), so keeping tmp_path in RAM avoids disk metadata work. An
+    explicit TMPDIR, PYTEST_DEBUG_TEMPROOT or --basetemp always wins.
+    """
+    if config.option.basetemp or os.getenv("TMPDIR") or os.getenv("PYTEST_DEBUG_TEMPROOT"):
+        return
+
+    temp_root = Path(tempfile.gettempdir()).resolve()
+    if _filesystem_type(temp_root) == "tmpfs":
+        return
+    if _filesystem_type(SHM_DIR) == "tmpfs" and os.access(SHM_DIR, os.W_OK):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = str(SHM_DIR)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep the manifest cache out of the user's real cache directory."""
+    cache_home = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home / "resourcelibrarian"
+
+
+class FrozenDateTime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW.replace(tzinfo=tz)
+
+
+@pytest.fixture
+def no_youtube_key(monkeypatch):
+    """Make sure no YouTube API key is visible, so fetches fail before any network call."""
+    monkeypatch.delenv("YOUTUBE_API_KEY", raising=False)
+
+
+@pytest.fixture(scope="module")
+def mock_video_metadata():
+    """YouTube API metadata for the test video dQw4w9WgXcQ."""
+    return {
+        "videoId": "dQw4w9WgXcQ",
+        "title": "Test Video",
+        "description": "A test video",
+        "thumbnails": {},
+        "channelId": "UCtest456789",
+        "channelTitle": "Test Channel",
+        "tags": ["test"],
+        "categoryId": "22",
+        "publishedAt": "2024-01-01T00:00:00Z",
+        "defaultLanguage": "en",
+        "defaultAudioLanguage": "en",
+    }
+
+
+@pytest.fixture(scope="session")
+def youtube_specs():
+    """Autospecced YouTube API and transcript classes, introspected once per session.
+
+    Returns:
+        Tuple of (YouTubeAPI spec, YouTubeTranscript spec)
+    """
+    from resourcelibrarian.sources.youtube_api import YouTubeAPI
+    from resourcelibrarian.sources.youtube_transcript import YouTubeTranscript
+
+    return create_autospec(YouTubeAPI), create_autospec(YouTubeTranscript)
+
+
+@pytest.fixture
+def patched_youtube(monkeypatch, youtube_specs, mock_video_metadata):
+    """Replace the YouTube API and transcript clients used by video ingestion.
+
+    The mocks are autospecced, so calls that don't match the real signatures fail.
+
+    Returns:
+        Tuple of (mock YouTubeAPI class, mock YouTubeTranscript class)
+    """
+    api, transcript = youtube_specs
+    # The specs are shared across the session; drop calls and side effects from earlier tests
+    api.reset_mock(side_effect=True)
+    transcript.reset_mock(side_effect=True)
+
+    # Copy so a test mutating the metadata can't leak into the next one
+    api.return_value.fetch_single_video.return_value = dict(mock_video_metadata)
+    transcript.fetch_transcript.return_value = ("This is a test transcript.", "en")
+
+    monkeypatch.setattr("resourcelibrarian.sources.video_ingestion.YouTubeAPI", api)
+    monkeypatch.setattr("resourcelibrarian.sources.video_ingestion.YouTubeTranscript", transcript)
+    return api, transcript
+
+
+@pytest.fixture
+def skip_index_markdown(monkeypatch):
+    """Skip the placeholder index markdown files that init writes.
+
+    For test modules that initialize many libraries but never read those files;
+    the directories are still created.
+    """
+    monkeypatch.setattr("resourcelibrarian.library._write_index_placeholders", lambda root: None)
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch):
+    """Stamp catalogs and index files with a fixed time instead of reading the clock."""
+    monkeypatch.setattr("resourcelibrarian.core.catalog_manager.datetime", FrozenDateTime)
+    monkeypatch.setattr("resourcelibrarian.core.index_generator.datetime", FrozenDateTime)
+    return FROZEN_NOW
+
+
+@pytest.fixture(autouse=True)
+def plain_console(monkeypatch):
+    """Render CLI output without colour, highlighting or terminal-width wrapping.
+
+    Assertions only look for substrings, so styling work is wasted, and a wide
+    console keeps long temp paths from being truncated inside panels. Markup
+    stays enabled so malformed markup still fails the tests.
+    """
+    from rich.console import Console
+
+    monkeypatch.setenv("NO_COLOR", "1")
+    monkeypatch.setenv("TERM", "dumb")
+    monkeypatch.setattr(
+        "resourcelibrarian.cli.commands.console",
+        Console(no_color=True, force_terminal=False, width=200, highlight=False),
+    )
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Provide the Typer app, imported once per session."""
+    from resourcelibrarian.cli.commands import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def library_template(tmp_path_factory):
+    """Initialize a library once per session for tests to copy.
+
+    Tests that only read from an empty library may use it directly; anything
+    that writes must use fresh_library instead.
+    """
+    from resourcelibrarian.library import ResourceLibrary
+
+    template_path = tmp_path_factory.mktemp("tpl") / "library"
+    ResourceLibrary.initialize(template_path)
+    return template_path
+
+
+@pytest.fixture(scope="session")
+def initialized_library(library_template):
+    """Provide a read-only ResourceLibrary for the session template."""
+    from resourcelibrarian.library import ResourceLibrary
+
+    return ResourceLibrary(library_template)
+
+
+@pytest.fixture(scope="session")
+def missing_library_path(tmp_path_factory):
+    """Path to a library that does not exist; never created on disk."""
+    return tmp_path_factory.getbasetemp() / "missing-library"
+
+
+@pytest.fixture
+def fresh_library(library_template, tmp_path):
+    """Provide a freshly initialized library copied from the session template.
+
+    Like tmp_path, the library lives under the tmpfs temp root chosen in
+    pytest_configure when one is available.
+    """
+    library_path = tmp_path / "library"
+    shutil.copytree(library_template, library_path)
+    return library_path
+
+
+@dataclass
+class DirectResult:
+    """Outcome of calling a CLI command function directly."""
+
+    exit_code: int
+    stdout: str
+
+
+def _invoke_direct(func, **kwargs) -> DirectResult:
+    """Call a Typer command function without going through CliRunner.
+
+    Parameters that are not passed fall back to the defaults declared in their
+    typer.Option/typer.Argument, and typer.Exit is translated into an exit code.
+    """
+    for name, param in inspect.signature(func).parameters.items():
+        if name not in kwargs and isinstance(param.default, ParameterInfo):
+            kwargs[name] = param.default.default
+
+    stdout = io.StringIO()
+    exit_code = 0
+    with contextlib.redirect_stdout(stdout):
+        try:
+            func(**kwargs)
+        except typer.Exit as e:
+            exit_code = e.exit_code
+    return DirectResult(exit_code=exit_code, stdout=stdout.getvalue())
+
+
+@pytest.fixture(scope="session")
+def invoke_direct():
+    """Provide a helper that runs CLI command functions in-process."""
+    return _invoke_direct
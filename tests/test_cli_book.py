@@ -5,15 +5,18 @@ Tests for:
 - rl book get (retrieve book content)
 """
 
-import yaml
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from resourcelibrarian.cli.commands import app
 from resourcelibrarian.library import ResourceLibrary
 from resourcelibrarian.models.book import Book, BookManifest
-from resourcelibrarian.utils.io import save_book_manifest, save_yaml
+from resourcelibrarian.utils.io import load_yaml, save_book_manifest, save_yaml
+
+# These tests initialize many libraries and never read the placeholder index files
+pytestmark = pytest.mark.usefixtures("skip_index_markdown")
 
 runner = CliRunner()
 
@@ -68,7 +71,7 @@ def create_test_book(
 
     # Add to catalog (matching CatalogManager format)
     catalog_path = library_path / "catalog.yaml"
-    catalog_data = yaml.safe_load(catalog_path.read_text())
+    catalog_data = load_yaml(catalog_path)
     catalog_data["books"].append(
         {
             "title": title,
@@ -368,7 +371,7 @@ def test_book_add_markdown_with_metadata(tmp_path):
 
     # Verify book was added to catalog
     catalog_path = library_path / "catalog.yaml"
-    catalog_data = yaml.safe_load(catalog_path.read_text())
+    catalog_data = load_yaml(catalog_path)
     assert len(catalog_data["books"]) == 1
 
     # Get book data from catalog
@@ -505,7 +508,7 @@ def test_book_add_updates_catalog(tmp_path):
 
     # Verify catalog has both books
     catalog_path = library_path / "catalog.yaml"
-    catalog_data = yaml.safe_load(catalog_path.read_text())
+    catalog_data = load_yaml(catalog_path)
     assert len(catalog_data["books"]) == 2
 
     titles = [book["title"] for book in catalog_data["books"]]
@@ -570,7 +573,7 @@ def test_book_add_author_name_parsing(tmp_path):
 
     # Verify folder structure follows lastname-firstname pattern
     catalog_path = library_path / "catalog.yaml"
-    catalog_data = yaml.safe_load(catalog_path.read_text())
+    catalog_data = load_yaml(catalog_path)
     folder_path = catalog_data["books"][0]["folder_path"]
 
     # Should be in format: books/smith-john/test-book
@@ -626,7 +629,7 @@ def test_book_import_folder_basic(tmp_path):
     catalog_path = library_path / "catalog.yaml"
     assert catalog_path.exists()
 
-    catalog_data = yaml.safe_load(catalog_path.read_text())
+    catalog_data = load_yaml(catalog_path)
     assert len(catalog_data["books"]) == 1
 
     book_data = catalog_data["books"][0]
@@ -656,7 +659,7 @@ def test_book_import_folder_basic(tmp_path):
     # Verify manifest
     manifest_path = book_path / "manifest.yaml"
     assert manifest_path.exists()
-    manifest_data = yaml.safe_load(manifest_path.read_text())
+    manifest_data = load_yaml(manifest_path)
     assert "summaries" in manifest_data
     assert "shortform" in manifest_data["summaries"]
 
@@ -3,22 +3,59 @@
 Tests the 'rl video list' and 'rl video get' commands.
 """
 
-import yaml
+import os
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
-from resourcelibrarian.cli.commands import app
-from resourcelibrarian.library import ResourceLibrary
+from resourcelibrarian.cli.commands import video_fetch, video_get, video_list
 from resourcelibrarian.models.video import Video, VideoManifest
-from resourcelibrarian.utils.io import save_video_manifest, save_yaml
+from resourcelibrarian.utils.io import load_yaml, save_video_manifest, save_yaml
 
 runner = CliRunner()
 
+_SLUG_TABLE = str.maketrans({" ": "-"})
+
+# Validated once; create_test_video copies it instead of re-running pydantic validation
+_TEMPLATE_MANIFEST = VideoManifest(
+    videoId="x",
+    title="x",
+    description="x",
+    url="https://www.youtube.com/watch?v=x",
+    channelId="x",
+    channelTitle="x",
+    tags=[],
+    categories=[],
+    publishedAt=datetime(2024, 1, 1),
+    source={"transcript_path": "source/transcript.txt"},
+)
+
+
+def _fast_write(path: Path, data: str) -> None:
+    """Write text to a file with a single open/write/close and no text wrapper."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data.encode("utf-8"))
+    finally:
+        os.close(fd)
 
-def create_test_video(
+
+def _append_catalog_entries(library_path: Path, entries: list[dict]) -> None:
+    """Append video entries to the library catalog in a single rewrite.
+
+    Args:
+        library_path: Path to library root
+        entries: Catalog entries for the videos
+    """
+    catalog_path = library_path / "catalog.yaml"
+    catalog_data = load_yaml(catalog_path)
+    catalog_data["videos"].extend(entries)
+    save_yaml(catalog_data, catalog_path)
+
+
+def _write_test_video(
     library_path: Path,
     video_id: str,
     title: str,
@@ -27,8 +64,8 @@ def create_test_video(
     categories: list[str] = None,
     tags: list[str] = None,
     transcript_content: str = "Sample video transcript",
-) -> Video:
-    """Helper to create a test video in the library.
+) -> tuple[Video, dict]:
+    """Write a test video's folder, transcript and manifest without touching the catalog.
 
     Args:
         library_path: Path to the library root
@@ -41,52 +78,89 @@ def create_test_video(
         transcript_content: Content for the transcript file
 
     Returns:
-        Video instance
+        Tuple of (Video instance, catalog entry for the video)
     """
     # Create folder structure: videos/channel__id/videoid__title/
-    channel_slug = f"{channel_title.lower().replace(' ', '-')}__{channel_id}"
-    title_slug = title.lower().replace(" ", "-")
+    channel_slug = f"{channel_title.lower().translate(_SLUG_TABLE)}__{channel_id}"
+    title_slug = title.lower().translate(_SLUG_TABLE)
     video_folder = library_path / "videos" / channel_slug / f"{video_id}__{title_slug}"
-    video_folder.mkdir(parents=True)
 
-    # Create source directory
+    # Create the video folder and its source directory in one walk
     source_dir = video_folder / "source"
-    source_dir.mkdir()
+    os.makedirs(source_dir, exist_ok=True)
 
     # Create transcript file
     transcript_path = source_dir / "transcript.txt"
-    transcript_path.write_text(transcript_content, encoding="utf-8")
-
-    # Create manifest
-    manifest = VideoManifest(
-        videoId=video_id,
-        title=title,
-        description=f"Description for {title}",
-        url=f"https://www.youtube.com/watch?v={video_id}",
-        channelId=channel_id,
-        channelTitle=channel_title,
-        tags=tags or [],
-        categories=categories or [],
-        publishedAt=datetime(2024, 1, 1),
-        source={"transcript_path": "source/transcript.txt"},
-    )
+    _fast_write(transcript_path, transcript_content)
 
-    save_video_manifest(manifest, video_folder)
-
-    # Add to catalog
-    catalog_path = library_path / "catalog.yaml"
-    catalog_data = yaml.safe_load(catalog_path.read_text())
-    catalog_data["videos"].append(
-        {
-            "video_id": video_id,
+    # Create manifest from the template; every mutable field gets a fresh object
+    # because model_copy is shallow
+    manifest = _TEMPLATE_MANIFEST.model_copy(
+        update={
+            "videoId": video_id,
             "title": title,
-            "channel_title": channel_title,
-            "folder_path": str(video_folder),
+            "description": f"Description for {title}",
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+            "channelId": channel_id,
+            "channelTitle": channel_title,
+            "tags": list(tags or []),
+            "categories": list(categories or []),
+            "thumbnails": {},
+            "source": {"transcript_path": "source/transcript.txt"},
+            "summaries": {},
+            "pointers": {},
         }
     )
-    save_yaml(catalog_data, catalog_path)
 
-    return Video(folder_path=video_folder, manifest=manifest)
+    save_video_manifest(manifest, video_folder)
+
+    entry = {
+        "video_id": video_id,
+        "title": title,
+        "channel_title": channel_title,
+        "folder_path": str(video_folder),
+    }
+    return Video(folder_path=video_folder, manifest=manifest), entry
+
+
+def create_test_video(
+    library_path: Path, video_id: str, title: str, channel_title: str, **kwargs
+) -> Video:
+    """Helper to create a test video in the library.
+
+    Args:
+        library_path: Path to the library root
+        video_id: YouTube video ID
+        title: Video title
+        channel_title: Channel name
+        **kwargs: Optional channel_id, categories, tags and transcript_content
+
+    Returns:
+        Video instance
+    """
+    video, entry = _write_test_video(library_path, video_id, title, channel_title, **kwargs)
+    _append_catalog_entries(library_path, [entry])
+    return video
+
+
+def create_test_videos(library_path: Path, specs: list[dict]) -> list[Video]:
+    """Helper to create several test videos with a single catalog write.
+
+    Args:
+        library_path: Path to the library root
+        specs: Keyword arguments for each video, as accepted by create_test_video
+
+    Returns:
+        List of Video instances
+    """
+    videos, entries = [], []
+    for spec in specs:
+        video, entry = _write_test_video(library_path, **spec)
+        videos.append(video)
+        entries.append(entry)
+
+    _append_catalog_entries(library_path, entries)
+    return videos
 
 
 # ============================================================================
@@ -94,10 +168,9 @@ def create_test_video(
 # ============================================================================
 
 
-def test_video_list_shows_all_videos(tmp_path):
+def test_video_list_shows_all_videos(fresh_library, app):
     """Test that 'rl video list' shows all videos in the library."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = fresh_library
 
     # Add test videos
     create_test_video(
@@ -125,161 +198,210 @@ def test_video_list_shows_all_videos(tmp_path):
     assert "ML Academy" in result.stdout
 
 
-def test_video_list_empty_library(tmp_path):
+def test_video_list_empty_library(library_template, invoke_direct):
     """Test 'rl video list' with empty library."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = library_template
 
-    result = runner.invoke(app, ["video", "list", "--library", str(library_path)])
+    result = invoke_direct(video_list, library_path=str(library_path))
 
     assert result.exit_code == 0
     assert "No videos in library yet" in result.stdout
 
 
-def test_video_list_filter_by_channel(tmp_path):
+def test_video_list_filter_by_channel(fresh_library, invoke_direct):
     """Test 'rl video list --channel' filters correctly."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = fresh_library
 
-    create_test_video(library_path, "abc123", "AI Introduction", "Tech Channel", categories=["AI"])
-    create_test_video(
-        library_path, "def456", "Python Tutorial", "Code Academy", categories=["Programming"]
+    create_test_videos(
+        library_path,
+        [
+            {
+                "video_id": "abc123",
+                "title": "AI Introduction",
+                "channel_title": "Tech Channel",
+                "categories": ["AI"],
+            },
+            {
+                "video_id": "def456",
+                "title": "Python Tutorial",
+                "channel_title": "Code Academy",
+                "categories": ["Programming"],
+            },
+        ],
     )
 
-    result = runner.invoke(
-        app, ["video", "list", "--library", str(library_path), "--channel", "Tech"]
-    )
+    result = invoke_direct(video_list, library_path=str(library_path), channel="Tech")
 
     assert result.exit_code == 0
     assert "AI Introduction" in result.stdout
     assert "Python Tutorial" not in result.stdout
 
 
-def test_video_list_filter_by_category(tmp_path):
+def test_video_list_filter_by_category(fresh_library, invoke_direct):
     """Test 'rl video list --category' filters correctly."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = fresh_library
 
-    create_test_video(
-        library_path, "abc123", "AI Introduction", "Tech Channel", categories=["AI", "Tutorials"]
-    )
-    create_test_video(
-        library_path, "def456", "Python Tutorial", "Code Academy", categories=["Programming"]
+    create_test_videos(
+        library_path,
+        [
+            {
+                "video_id": "abc123",
+                "title": "AI Introduction",
+                "channel_title": "Tech Channel",
+                "categories": ["AI", "Tutorials"],
+            },
+            {
+                "video_id": "def456",
+                "title": "Python Tutorial",
+                "channel_title": "Code Academy",
+                "categories": ["Programming"],
+            },
+        ],
     )
 
-    result = runner.invoke(
-        app, ["video", "list", "--library", str(library_path), "--category", "AI"]
-    )
+    result = invoke_direct(video_list, library_path=str(library_path), category="AI")
 
     assert result.exit_code == 0
     assert "AI Introduction" in result.stdout
     assert "Python Tutorial" not in result.stdout
 
 
-def test_video_list_filter_by_tag(tmp_path):
+def test_video_list_filter_by_tag(fresh_library, invoke_direct):
     """Test 'rl video list --tag' filters correctly."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = fresh_library
 
-    create_test_video(
-        library_path, "abc123", "AI Introduction", "Tech Channel", tags=["beginner", "ai"]
+    create_test_videos(
+        library_path,
+        [
+            {
+                "video_id": "abc123",
+                "title": "AI Introduction",
+                "channel_title": "Tech Channel",
+                "tags": ["beginner", "ai"],
+            },
+            {
+                "video_id": "def456",
+                "title": "Advanced ML",
+                "channel_title": "ML Academy",
+                "tags": ["advanced", "ml"],
+            },
+        ],
     )
-    create_test_video(library_path, "def456", "Advanced ML", "ML Academy", tags=["advanced", "ml"])
 
-    result = runner.invoke(
-        app, ["video", "list", "--library", str(library_path), "--tag", "beginner"]
-    )
+    result = invoke_direct(video_list, library_path=str(library_path), tag="beginner")
 
     assert result.exit_code == 0
     assert "AI Introduction" in result.stdout
     assert "Advanced ML" not in result.stdout
 
 
-def test_video_list_filter_by_title(tmp_path):
+def test_video_list_filter_by_title(fresh_library, invoke_direct):
     """Test 'rl video list --title' filters correctly."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = fresh_library
 
-    create_test_video(library_path, "abc123", "AI Introduction", "Tech Channel")
-    create_test_video(library_path, "def456", "Machine Learning Basics", "ML Academy")
-
-    result = runner.invoke(
-        app, ["video", "list", "--library", str(library_path), "--title", "Introduction"]
+    create_test_videos(
+        library_path,
+        [
+            {"video_id": "abc123", "title": "AI Introduction", "channel_title": "Tech Channel"},
+            {
+                "video_id": "def456",
+                "title": "Machine Learning Basics",
+                "channel_title": "ML Academy",
+            },
+        ],
     )
 
+    result = invoke_direct(video_list, library_path=str(library_path), title="Introduction")
+
     assert result.exit_code == 0
     assert "AI Introduction" in result.stdout
     assert "Machine Learning Basics" not in result.stdout
 
 
-def test_video_list_multiple_filters(tmp_path):
+def test_video_list_multiple_filters(fresh_library, invoke_direct):
     """Test 'rl video list' with multiple filters."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = fresh_library
 
-    create_test_video(
-        library_path,
-        "abc123",
-        "AI Introduction",
-        "Tech Channel",
-        categories=["AI"],
-        tags=["beginner"],
-    )
-    create_test_video(
-        library_path,
-        "def456",
-        "Advanced AI",
-        "Tech Channel",
-        categories=["AI"],
-        tags=["advanced"],
-    )
-    create_test_video(
+    create_test_videos(
         library_path,
-        "ghi789",
-        "Python Basics",
-        "Code Academy",
-        categories=["Programming"],
-        tags=["beginner"],
-    )
-
-    result = runner.invoke(
-        app,
         [
-            "video",
-            "list",
-            "--library",
-            str(library_path),
-            "--channel",
-            "Tech",
-            "--tag",
-            "beginner",
+            {
+                "video_id": "abc123",
+                "title": "AI Introduction",
+                "channel_title": "Tech Channel",
+                "categories": ["AI"],
+                "tags": ["beginner"],
+            },
+            {
+                "video_id": "def456",
+                "title": "Advanced AI",
+                "channel_title": "Tech Channel",
+                "categories": ["AI"],
+                "tags": ["advanced"],
+            },
+            {
+                "video_id": "ghi789",
+                "title": "Python Basics",
+                "channel_title": "Code Academy",
+                "categories": ["Programming"],
+                "tags": ["beginner"],
+            },
         ],
     )
 
+    result = invoke_direct(
+        video_list, library_path=str(library_path), channel="Tech", tag="beginner"
+    )
+
     assert result.exit_code == 0
     assert "AI Introduction" in result.stdout
     assert "Advanced AI" not in result.stdout  # wrong tag
     assert "Python Basics" not in result.stdout  # wrong channel
 
 
-def test_video_list_no_matches(tmp_path):
+def test_video_list_no_matches(fresh_library, invoke_direct):
     """Test 'rl video list' with no matching results."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = fresh_library
 
     create_test_video(library_path, "abc123", "AI Introduction", "Tech Channel")
 
-    result = runner.invoke(
-        app, ["video", "list", "--library", str(library_path), "--channel", "Nonexistent"]
-    )
+    result = invoke_direct(video_list, library_path=str(library_path), channel="Nonexistent")
 
     assert result.exit_code == 0
     assert "No videos found matching filters" in result.stdout
 
 
-def test_video_list_library_not_found(tmp_path):
+@pytest.mark.perf
+def test_video_list_filters_large_library(fresh_library, invoke_direct):
+    """Test 'rl video list' filtering over a library of 1000 videos."""
+    library_path = fresh_library
+
+    create_test_videos(
+        library_path,
+        [
+            {
+                "video_id": f"vid{i:04d}",
+                "title": f"Video {i:04d}",
+                "channel_title": f"Channel {i % 10}",
+                "categories": ["AI" if i % 2 else "Programming"],
+                "tags": ["beginner" if i % 5 == 0 else "advanced"],
+            }
+            for i in range(1000)
+        ],
+    )
+
+    result = invoke_direct(
+        video_list, library_path=str(library_path), channel="Channel 5", tag="BEGINNER"
+    )
+
+    # Channel 5 holds i % 10 == 5, all of which are also i % 5 == 0
+    assert result.exit_code == 0
+    assert "Videos in Library (100 found)" in result.stdout
+
+
+def test_video_list_library_not_found(missing_library_path, invoke_direct):
     """Test 'rl video list' with non-existent library."""
-    result = runner.invoke(app, ["video", "list", "--library", str(tmp_path / "nonexistent")])
+    result = invoke_direct(video_list, library_path=str(missing_library_path))
 
     assert result.exit_code == 1
     assert "Not a valid Resource Library" in result.stdout
@@ -290,10 +412,9 @@ def test_video_list_library_not_found(tmp_path):
 # ============================================================================
 
 
-def test_video_get_retrieves_transcript(tmp_path):
+def test_video_get_retrieves_transcript(fresh_library, app):
     """Test that 'rl video get' retrieves video transcript."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = fresh_library
 
     create_test_video(
         library_path,
@@ -312,10 +433,9 @@ def test_video_get_retrieves_transcript(tmp_path):
     assert "This is the AI introduction transcript." in result.stdout
 
 
-def test_video_get_saves_to_file(tmp_path):
+def test_video_get_saves_to_file(fresh_library, tmp_path, invoke_direct):
     """Test that 'rl video get --output' saves transcript to file."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = fresh_library
 
     create_test_video(
         library_path,
@@ -326,17 +446,8 @@ def test_video_get_saves_to_file(tmp_path):
     )
 
     output_file = tmp_path / "transcript.txt"
-    result = runner.invoke(
-        app,
-        [
-            "video",
-            "get",
-            "abc123",
-            "--library",
-            str(library_path),
-            "--output",
-            str(output_file),
-        ],
+    result = invoke_direct(
+        video_get, identifier="abc123", library_path=str(library_path), output=str(output_file)
     )
 
     assert result.exit_code == 0
@@ -345,22 +456,19 @@ def test_video_get_saves_to_file(tmp_path):
     assert output_file.read_text() == "This is the AI introduction transcript."
 
 
-def test_video_get_video_not_found(tmp_path):
+def test_video_get_video_not_found(library_template, invoke_direct):
     """Test 'rl video get' with non-existent video."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    library_path = library_template
 
-    result = runner.invoke(app, ["video", "get", "nonexistent", "--library", str(library_path)])
+    result = invoke_direct(video_get, identifier="nonexistent", library_path=str(library_path))
 
     assert result.exit_code == 1
     assert "Video not found" in result.stdout
 
 
-def test_video_get_library_not_found(tmp_path):
+def test_video_get_library_not_found(missing_library_path, invoke_direct):
     """Test 'rl video get' with non-existent library."""
-    result = runner.invoke(
-        app, ["video", "get", "abc123", "--library", str(tmp_path / "nonexistent")]
-    )
+    result = invoke_direct(video_get, identifier="abc123", library_path=str(missing_library_path))
 
     assert result.exit_code == 1
     assert "Not a valid Resource Library" in result.stdout
@@ -371,229 +479,130 @@ def test_video_get_library_not_found(tmp_path):
 # ============================================================================
 
 
-def test_video_fetch_shows_not_implemented(tmp_path):
-    """Test that 'rl video fetch' fails when YouTube API key is missing."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+@pytest.mark.parametrize(
+    "video_url, library_exists, expected",
+    [
+        ("dQw4w9WgXcQ", True, "YouTube API key required"),
+        ("not-a-valid-url", True, "Invalid YouTube video URL or ID"),
+        ("dQw4w9WgXcQ", False, "Not a valid Resource Library"),
+    ],
+    ids=["missing-api-key", "invalid-url", "library-not-found"],
+)
+def test_video_fetch_error_paths(
+    library_template,
+    missing_library_path,
+    invoke_direct,
+    no_youtube_key,
+    video_url,
+    library_exists,
+    expected,
+):
+    """Test that 'rl video fetch' reports each failure before writing anything."""
+    # Every case fails before touching the library, so the shared template stays intact
+    library_path = library_template if library_exists else missing_library_path
+
+    result = invoke_direct(video_fetch, video_url=video_url, library_path=str(library_path))
 
-    # Make sure YOUTUBE_API_KEY is not set
-    import os
+    assert result.exit_code == 1
+    assert expected in result.stdout
 
-    old_key = os.environ.get("YOUTUBE_API_KEY")
-    if old_key:
-        del os.environ["YOUTUBE_API_KEY"]
 
-    try:
-        result = runner.invoke(
-            app,
-            [
-                "video",
-                "fetch",
-                "dQw4w9WgXcQ",
-                "--library",
-                str(library_path),
-            ],
-        )
-
-        assert result.exit_code == 1
-        assert "YouTube API key required" in result.stdout
-    finally:
-        # Restore old key if it existed
-        if old_key:
-            os.environ["YOUTUBE_API_KEY"] = old_key
+def test_video_fetch_extracts_video_id_from_url(library_template, invoke_direct, no_youtube_key):
+    """Test that video fetch extracts the video ID from a URL and reports it.
 
+    URL parsing itself is covered by the extract_video_id tests; this checks the
+    command wires the extracted ID through.
+    """
+    # Without an API key the fetch stops before writing, so the shared template stays intact
+    result = invoke_direct(
+        video_fetch,
+        video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ&feature=share",
+        library_path=str(library_template),
+    )
 
-def test_video_fetch_invalid_url(tmp_path):
-    """Test 'rl video fetch' with invalid YouTube URL."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    assert "dQw4w9WgXcQ" in result.stdout
 
-    result = runner.invoke(
-        app,
-        [
-            "video",
-            "fetch",
-            "not-a-valid-url",
-            "--library",
-            str(library_path),
-        ],
+
+def test_video_fetch_with_categories_and_tags(fresh_library, invoke_direct, no_youtube_key):
+    """Test 'rl video fetch' with categories and tags options."""
+    library_path = fresh_library
+
+    # API key is not set, so this fails, but the options are still accepted
+    result = invoke_direct(
+        video_fetch,
+        video_url="dQw4w9WgXcQ",
+        library_path=str(library_path),
+        categories="Music,Entertainment",
+        tags="test,sample",
     )
 
+    # Should fail due to missing API key
     assert result.exit_code == 1
-    assert "Invalid YouTube video URL or ID" in result.stdout
+    assert "YouTube API key required" in result.stdout
+
 
+def test_video_fetch_successfully_adds_video_with_mocks(fresh_library, app, patched_youtube):
+    """Test successful video fetch with mocked YouTube API and transcript."""
+    library_path = fresh_library
+    MockAPI, MockTranscript = patched_youtube
+
+    # Use a valid 11-character video ID
+    video_id = "dQw4w9WgXcQ"
+    mock_transcript = "This is a test transcript."
 
-def test_video_fetch_library_not_found(tmp_path):
-    """Test 'rl video fetch' with non-existent library."""
     result = runner.invoke(
         app,
         [
             "video",
             "fetch",
-            "dQw4w9WgXcQ",
+            video_id,
             "--library",
-            str(tmp_path / "nonexistent"),
+            str(library_path),
+            "--categories",
+            "Education",
+            "--tags",
+            "tutorial",
         ],
     )
 
-    assert result.exit_code == 1
-    assert "Not a valid Resource Library" in result.stdout
-
-
-def test_video_fetch_extracts_video_id_from_urls(tmp_path):
-    """Test that video fetch correctly extracts video IDs from various URL formats."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
-
-    # Test various URL formats - all should extract the same video ID
-    test_urls = [
-        "dQw4w9WgXcQ",  # Just the ID
-        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",  # Standard URL
-        "https://youtu.be/dQw4w9WgXcQ",  # Short URL
-        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&feature=share",  # With params
-    ]
-
-    for url in test_urls:
-        result = runner.invoke(
-            app,
-            [
-                "video",
-                "fetch",
-                url,
-                "--library",
-                str(library_path),
-            ],
-        )
-
-        # All should show the processing message with the video ID
-        assert "dQw4w9WgXcQ" in result.stdout or "Fetching YouTube video" in result.stdout
-
-
-def test_video_fetch_with_categories_and_tags(tmp_path):
-    """Test 'rl video fetch' with categories and tags options."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    # Should succeed
+    assert result.exit_code == 0
+    assert "Video added successfully" in result.stdout
+    assert "Test Video" in result.stdout
+    assert "Test Channel" in result.stdout
 
-    # Make sure API key is not set (will fail, but we can test arg parsing)
-    import os
+    # Verify folder structure was created
+    videos_dir = library_path / "videos"
+    assert videos_dir.exists()
 
-    old_key = os.environ.get("YOUTUBE_API_KEY")
-    if old_key:
-        del os.environ["YOUTUBE_API_KEY"]
+    # Check that a channel folder was created (exclude _index folder)
+    channel_folders = [e for e in os.scandir(videos_dir) if e.name != "_index"]
+    assert len(channel_folders) == 1
 
-    try:
-        result = runner.invoke(
-            app,
-            [
-                "video",
-                "fetch",
-                "dQw4w9WgXcQ",
-                "--library",
-                str(library_path),
-                "--categories",
-                "Music,Entertainment",
-                "--tags",
-                "test,sample",
-            ],
-        )
-
-        # Should fail due to missing API key
-        assert result.exit_code == 1
-        assert "YouTube API key required" in result.stdout
-    finally:
-        if old_key:
-            os.environ["YOUTUBE_API_KEY"] = old_key
+    # Check that video folder was created (channel folder should contain video folder + index.md)
+    channel_contents = list(os.scandir(channel_folders[0].path))
+    # Should have: 1 video folder + 1 index.md file
+    assert len(channel_contents) == 2
 
+    # Get the video folder (not the index.md file)
+    video_folders = [entry for entry in channel_contents if entry.is_dir()]
+    assert len(video_folders) == 1
 
-def test_video_fetch_successfully_adds_video_with_mocks(tmp_path):
-    """Test successful video fetch with mocked YouTube API and transcript."""
-    library_path = tmp_path / "library"
-    ResourceLibrary.initialize(library_path)
+    video_folder = Path(video_folders[0].path)
 
-    # Use a valid 11-character video ID
-    video_id = "dQw4w9WgXcQ"
+    # Verify channel index.md was created (channel_contents was already listed above)
+    assert "index.md" in {entry.name for entry in channel_contents}
 
-    # Mock video metadata
-    mock_metadata = {
-        "videoId": video_id,
-        "title": "Test Video",
-        "description": "A test video",
-        "thumbnails": {},
-        "channelId": "UCtest456789",
-        "channelTitle": "Test Channel",
-        "tags": ["test"],
-        "categoryId": "22",
-        "publishedAt": "2024-01-01T00:00:00Z",
-        "defaultLanguage": "en",
-        "defaultAudioLanguage": "en",
-    }
+    # One directory listing per folder instead of a stat() per expected file
+    source_names = {entry.name for entry in os.scandir(video_folder / "source")}
+    assert {"transcript.txt", "video.url"} <= source_names
+    assert "manifest.yaml" in {entry.name for entry in os.scandir(video_folder)}
 
-    mock_transcript = "This is a test transcript."
+    # Verify transcript content
+    transcript_content = (video_folder / "source" / "transcript.txt").read_text()
+    assert transcript_content == mock_transcript
 
-    # Mock the YouTube API and Transcript classes
-    with (
-        patch("resourcelibrarian.sources.video_ingestion.YouTubeAPI") as MockAPI,
-        patch("resourcelibrarian.sources.video_ingestion.YouTubeTranscript") as MockTranscript,
-    ):
-        # Configure mocks
-        mock_api_instance = MagicMock()
-        mock_api_instance.fetch_single_video.return_value = mock_metadata
-        MockAPI.return_value = mock_api_instance
-
-        MockTranscript.fetch_transcript.return_value = (mock_transcript, "en")
-
-        result = runner.invoke(
-            app,
-            [
-                "video",
-                "fetch",
-                video_id,
-                "--library",
-                str(library_path),
-                "--categories",
-                "Education",
-                "--tags",
-                "tutorial",
-            ],
-        )
-
-        # Should succeed
-        assert result.exit_code == 0
-        assert "Video added successfully" in result.stdout
-        assert "Test Video" in result.stdout
-        assert "Test Channel" in result.stdout
-
-        # Verify folder structure was created
-        videos_dir = library_path / "videos"
-        assert videos_dir.exists()
-
-        # Check that a channel folder was created (exclude _index folder)
-        channel_folders = [d for d in videos_dir.iterdir() if d.name != "_index"]
-        assert len(channel_folders) == 1
-
-        # Check that video folder was created (channel folder should contain video folder + index.md)
-        channel_folder = channel_folders[0]
-        channel_contents = list(channel_folder.iterdir())
-        # Should have: 1 video folder + 1 index.md file
-        assert len(channel_contents) == 2
-
-        # Get the video folder (not the index.md file)
-        video_folders = [item for item in channel_contents if item.is_dir()]
-        assert len(video_folders) == 1
-
-        video_folder = video_folders[0]
-
-        # Verify channel index.md was created
-        assert (channel_folder / "index.md").exists()
-        assert (video_folder / "source" / "transcript.txt").exists()
-        assert (video_folder / "source" / "video.url").exists()
-        assert (video_folder / "manifest.yaml").exists()
-
-        # Verify transcript content
-        transcript_content = (video_folder / "source" / "transcript.txt").read_text()
-        assert transcript_content == mock_transcript
-
-        # Verify API calls were made
-        MockAPI.assert_called_once()
-        mock_api_instance.fetch_single_video.assert_called_once_with(video_id)
-        MockTranscript.fetch_transcript.assert_called_once_with(video_id)
+    # Verify API calls were made
+    MockAPI.assert_called_once()
+    MockAPI.return_value.fetch_single_video.assert_called_once_with(video_id)
+    MockTranscript.fetch_transcript.assert_called_once_with(video_id)
@@ -0,0 +1,32 @@
+"""Tests for catalog management."""
+
+from resourcelibrarian.core.catalog_manager import CatalogManager
+from resourcelibrarian.models import BookManifest
+from resourcelibrarian.utils.io import save_book_manifest
+
+
+def test_rebuild_catalog_scans_resource_folders(fresh_library):
+    """Test that rebuilding finds manifests two levels down and skips other entries."""
+    books_dir = fresh_library / "books"
+    manifest = BookManifest(title="Found", author="Author", source_folder="author/found")
+    save_book_manifest(manifest, books_dir / "author" / "found")
+
+    # Neither a stray file nor a folder without a manifest is a book
+    (books_dir / "author" / "index.md").write_text("# Author\n")
+    (books_dir / "author" / "empty").mkdir()
+    (books_dir / "notes.md").write_text("notes\n")
+    save_book_manifest(manifest, books_dir / "_index" / "ignored")
+
+    catalog = CatalogManager(fresh_library).rebuild_catalog()
+
+    assert [book.title for book in catalog.books] == ["Found"]
+    assert catalog.books[0].folder_path == books_dir / "author" / "found"
+    assert catalog.videos == []
+
+
+def test_rebuild_catalog_without_resource_dirs(tmp_path):
+    """Test that missing books/ and videos/ directories yield an empty catalog."""
+    catalog = CatalogManager(tmp_path).rebuild_catalog()
+
+    assert catalog.books == []
+    assert catalog.videos == []
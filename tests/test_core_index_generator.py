@@ -0,0 +1,60 @@
+"""Tests for index generation."""
+
+from pathlib import Path
+
+from resourcelibrarian.core.index_generator import IndexGenerator
+from resourcelibrarian.models import Book, BookManifest, Video, VideoManifest
+
+
+def touch(path: Path) -> None:
+    """Create an empty file, including its parent folders."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("")
+
+
+def test_book_index_links_only_existing_files(tmp_path):
+    """Test that the book index lists formats and summaries whose files exist."""
+    folder = tmp_path / "books" / "author" / "book"
+    touch(folder / "full-book-formats" / "book.pdf")
+    touch(folder / "summaries" / "short.md")
+    (folder / "summaries" / "dangling.md").symlink_to(folder / "summaries" / "gone.md")
+
+    manifest = BookManifest(
+        title="Book",
+        author="Author",
+        source_folder="author/book",
+        formats={"pdf": "full-book-formats/book.pdf", "epub": "full-book-formats/book.epub"},
+        summaries={
+            "short": "summaries/short.md",
+            "dangling": "summaries/dangling.md",
+            "nofolder": "missing/long.md",
+        },
+    )
+    IndexGenerator(tmp_path).generate_book_index(Book(folder_path=folder, manifest=manifest))
+
+    index = (folder / "index.md").read_text()
+    assert "[book.pdf](full-book-formats/book.pdf)" in index
+    assert "[short.md](summaries/short.md)" in index
+    assert "book.epub" not in index
+    assert "dangling.md" not in index
+    assert "long.md" not in index
+
+
+def test_video_index_links_existing_transcript(tmp_path):
+    """Test that the video index links the transcript only when it exists."""
+    folder = tmp_path / "videos" / "channel" / "video"
+    touch(folder / "source" / "transcript.txt")
+
+    manifest = VideoManifest(
+        videoId="vid1",
+        title="Video",
+        channelId="ch1",
+        channelTitle="Channel",
+        source={"transcript_path": "source/transcript.txt"},
+        summaries={"ai": "summaries/ai.md"},
+    )
+    IndexGenerator(tmp_path).generate_video_index(Video(folder_path=folder, manifest=manifest))
+
+    index = (folder / "index.md").read_text()
+    assert "[transcript.txt](source/transcript.txt)" in index
+    assert "ai.md" not in index
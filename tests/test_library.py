@@ -1,8 +1,10 @@
 """Tests for ResourceLibrary class."""
 
+from pathlib import Path
+
 import pytest
-import yaml
 from resourcelibrarian.library import ResourceLibrary
+from resourcelibrarian.utils.io import load_yaml
 
 
 def test_initialize_creates_structure(tmp_path):
@@ -23,27 +25,23 @@ def test_initialize_creates_structure(tmp_path):
     assert (library_path / "videos" / "_index").exists()
 
 
-def test_initialize_creates_catalog_file(tmp_path):
+def test_initialize_creates_catalog_file(initialized_library):
     """Test that initialize creates catalog.yaml with correct structure."""
-    library_path = tmp_path / "test-library"
-
-    ResourceLibrary.initialize(library_path)
+    library_path = initialized_library.root
 
     catalog_file = library_path / "catalog.yaml"
     assert catalog_file.exists()
 
-    catalog_data = yaml.safe_load(catalog_file.read_text())
+    catalog_data = load_yaml(catalog_file)
     assert catalog_data["version"] == "1.0"
     assert catalog_data["books"] == []
     assert catalog_data["videos"] == []
     assert "last_updated" in catalog_data
 
 
-def test_initialize_creates_index_files(tmp_path):
+def test_initialize_creates_index_files(initialized_library):
     """Test that initialize creates index markdown files."""
-    library_path = tmp_path / "test-library"
-
-    ResourceLibrary.initialize(library_path)
+    library_path = initialized_library.root
 
     # Library-wide index
     assert (library_path / "_index" / "README.md").exists()
@@ -67,45 +65,49 @@ def test_initialize_raises_error_if_directory_exists(tmp_path):
     assert "already exists" in str(exc_info.value)
 
 
-def test_exists_returns_true_for_valid_library(tmp_path):
+def test_exists_returns_true_for_valid_library(initialized_library):
     """Test that exists() returns True for a valid library."""
-    library_path = tmp_path / "test-library"
-    library = ResourceLibrary.initialize(library_path)
+    assert initialized_library.exists() is True
 
-    assert library.exists() is True
 
-
-def test_exists_returns_false_for_invalid_library(tmp_path):
+def test_exists_returns_false_for_invalid_library(missing_library_path):
     """Test that exists() returns False for an invalid library."""
-    library_path = tmp_path / "nonexistent-library"
+    library_path = missing_library_path
     library = ResourceLibrary(library_path)
 
     assert library.exists() is False
 
 
-def test_library_init_sets_paths(tmp_path):
-    """Test that __init__ correctly sets all paths."""
-    library_path = tmp_path / "test-library"
-    library = ResourceLibrary(library_path)
+def test_library_init_sets_paths(initialized_library, monkeypatch):
+    """Test that __init__ resolves the root and sets all paths from it."""
+    library_root = initialized_library.root
+    # A relative path through "..", so only resolve() can turn it into the root
+    monkeypatch.chdir(library_root / "books")
+    unresolved = Path("..") / ".." / library_root.name
 
-    assert library.root == library_path.resolve()
-    assert library.catalog_path == library_path.resolve() / "catalog.yaml"
-    assert library.books_dir == library_path.resolve() / "books"
-    assert library.videos_dir == library_path.resolve() / "videos"
-    assert library.index_dir == library_path.resolve() / "_index"
+    library = ResourceLibrary(unresolved)
 
+    expected_root = unresolved.resolve()
+    assert expected_root == library_root
+    assert library.root == expected_root
+    assert library.root.is_absolute()
+    assert library.catalog_path == expected_root / "catalog.yaml"
+    assert library.books_dir == expected_root / "books"
+    assert library.videos_dir == expected_root / "videos"
+    assert library.index_dir == expected_root / "_index"
 
-def test_library_str_representation(tmp_path):
+
+def test_library_str_representation(initialized_library):
     """Test that __str__ returns a readable representation."""
-    library_path = tmp_path / "test-library"
+    library_path = initialized_library.root
     library = ResourceLibrary(library_path)
 
     assert str(library) == f"ResourceLibrary({library_path.resolve()})"
 
 
-def test_library_repr_representation(tmp_path):
+def test_library_repr_representation(initialized_library):
     """Test that __repr__ returns a developer representation."""
-    library_path = tmp_path / "test-library"
+    library_path = initialized_library.root
     library = ResourceLibrary(library_path)
 
     assert repr(library) == f"ResourceLibrary(root_path={library_path.resolve()!r})"
@@ -3,6 +3,8 @@
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from resourcelibrarian.models import (
     Book,
     BookManifest,
@@ -13,6 +15,21 @@ from resourcelibrarian.models import (
 )
 
 
+def make_book(folder: str, **fields) -> Book:
+    """Create a Book with placeholder metadata, overridden by the given manifest fields."""
+    manifest = BookManifest(
+        **{"title": "Test", "author": "Test", "source_folder": "test", **fields}
+    )
+    return Book(folder_path=Path(folder), manifest=manifest)
+
+
+def make_video(folder: str, **fields) -> Video:
+    """Create a Video with placeholder metadata, overridden by the given manifest fields."""
+    defaults = {"videoId": "vid1", "title": "Test", "channelId": "ch1", "channelTitle": "Test Ch"}
+    manifest = VideoManifest(**{**defaults, **fields})
+    return Video(folder_path=Path(folder), manifest=manifest)
+
+
 # ========================================
 # SourceKind Enum Tests
 # ========================================
@@ -120,62 +137,37 @@ def test_book_creation():
     assert book.manifest == manifest
 
 
-def test_book_title_property():
-    """Test Book title property."""
-    manifest = BookManifest(title="Property Test", author="Test Author", source_folder="prop-test")
-    book = Book(folder_path=Path("/test"), manifest=manifest)
-
-    assert book.title == "Property Test"
-
-
-def test_book_author_property():
-    """Test Book author property."""
-    manifest = BookManifest(title="Test", author="Famous Author", source_folder="test")
-    book = Book(folder_path=Path("/test"), manifest=manifest)
-
-    assert book.author == "Famous Author"
-
-
-def test_book_categories_property():
-    """Test Book categories property."""
-    manifest = BookManifest(
-        title="Test", author="Test", source_folder="test", categories=["ai", "ml"]
-    )
-    book = Book(folder_path=Path("/test"), manifest=manifest)
-
-    assert book.categories == ["ai", "ml"]
-
-
-def test_book_tags_property():
-    """Test Book tags property."""
+@pytest.fixture(scope="module")
+def filled_book():
+    """Book with every field the properties expose set to a distinct value."""
     manifest = BookManifest(
-        title="Test",
-        author="Test",
-        source_folder="test",
+        title="Property Test",
+        author="Famous Author",
+        source_folder="original-folder",
+        categories=["ai", "ml"],
         tags=["python", "advanced"],
     )
-    book = Book(folder_path=Path("/test"), manifest=manifest)
+    return Book(folder_path=Path("/test"), manifest=manifest)
 
-    assert book.tags == ["python", "advanced"]
 
-
-def test_book_source_folder_property():
-    """Test Book source_folder property."""
-    manifest = BookManifest(title="Test", author="Test", source_folder="original-folder")
-    book = Book(folder_path=Path("/test"), manifest=manifest)
-
-    assert book.source_folder == "original-folder"
+@pytest.mark.parametrize(
+    "attr, expected",
+    [
+        ("title", "Property Test"),
+        ("author", "Famous Author"),
+        ("categories", ["ai", "ml"]),
+        ("tags", ["python", "advanced"]),
+        ("source_folder", "original-folder"),
+    ],
+)
+def test_book_property(filled_book, attr, expected):
+    """Test that Book properties read through to the manifest."""
+    assert getattr(filled_book, attr) == expected
 
 
 def test_book_get_format_path():
     """Test Book.get_format_path method."""
-    manifest = BookManifest(
-        title="Test",
-        author="Test",
-        source_folder="test",
-        formats={"pdf": "book.pdf", "epub": "book.epub"},
-    )
-    book = Book(folder_path=Path("/library/books/test"), manifest=manifest)
+    book = make_book("/library/books/test", formats={"pdf": "book.pdf", "epub": "book.epub"})
 
     pdf_path = book.get_format_path("pdf")
     assert pdf_path == Path("/library/books/test/book.pdf")
@@ -189,13 +181,10 @@ def test_book_get_format_path():
 
 def test_book_get_summary_path():
     """Test Book.get_summary_path method."""
-    manifest = BookManifest(
-        title="Test",
-        author="Test",
-        source_folder="test",
+    book = make_book(
+        "/library/books/test",
         summaries={"shortform": "summaries/short.md", "ai": "summaries/ai.md"},
     )
-    book = Book(folder_path=Path("/library/books/test"), manifest=manifest)
 
     short_path = book.get_summary_path("shortform")
     assert short_path == Path("/library/books/test/summaries/short.md")
@@ -209,13 +198,9 @@ def test_book_get_summary_path():
 
 def test_book_list_formats():
     """Test Book.list_formats method."""
-    manifest = BookManifest(
-        title="Test",
-        author="Test",
-        source_folder="test",
-        formats={"pdf": "book.pdf", "epub": "book.epub", "markdown": "book.md"},
+    book = make_book(
+        "/test", formats={"pdf": "book.pdf", "epub": "book.epub", "markdown": "book.md"}
     )
-    book = Book(folder_path=Path("/test"), manifest=manifest)
 
     formats = book.list_formats()
     assert set(formats) == {"pdf", "epub", "markdown"}
@@ -223,18 +208,22 @@ def test_book_list_formats():
 
 def test_book_list_summaries():
     """Test Book.list_summaries method."""
-    manifest = BookManifest(
-        title="Test",
-        author="Test",
-        source_folder="test",
-        summaries={"shortform": "short.md", "ai": "ai.md"},
-    )
-    book = Book(folder_path=Path("/test"), manifest=manifest)
+    book = make_book("/test", summaries={"shortform": "short.md", "ai": "ai.md"})
 
     summaries = book.list_summaries()
     assert set(summaries) == {"shortform", "ai"}
 
 
+@pytest.mark.parametrize("model, kind", [(Book, "Book"), (Video, "Video")])
+def test_from_folder_reports_missing_folder_or_manifest(tmp_path, model, kind):
+    """Test that from_folder distinguishes a missing folder from a missing manifest."""
+    with pytest.raises(FileNotFoundError, match=f"{kind} folder not found"):
+        model.from_folder(tmp_path / "missing")
+
+    with pytest.raises(FileNotFoundError, match="No manifest.yaml found"):
+        model.from_folder(tmp_path)
+
+
 # ========================================
 # VideoManifest Tests
 # ========================================
@@ -342,6 +331,31 @@ def test_video_manifest_to_yaml_dict_none_published():
     assert yaml_dict["publishedAt"] is None
 
 
+@pytest.mark.parametrize(
+    "manifest",
+    [
+        BookManifest(
+            title="T", author="A", source_folder="a/t", isbn="1", formats={"pdf": "t.pdf"}
+        ),
+        VideoManifest(
+            videoId="vid1",
+            title="T",
+            channelId="ch1",
+            channelTitle="C",
+            thumbnails={"default": {"url": "u", "width": 120}},
+            publishedAt=datetime(2024, 6, 15, 10, 30, 0),
+        ),
+    ],
+    ids=["book", "video"],
+)
+def test_manifest_to_yaml_dict_matches_model_dump(manifest):
+    """Test that the hand-written to_yaml_dict covers every field, in declaration order."""
+    yaml_dict = manifest.to_yaml_dict()
+
+    assert list(yaml_dict) == list(type(manifest).model_fields)
+    assert yaml_dict == manifest.model_dump(mode="json")
+
+
 # ========================================
 # Video Tests
 # ========================================
@@ -358,88 +372,39 @@ def test_video_creation():
     assert video.manifest == manifest
 
 
-def test_video_id_property():
-    """Test Video.video_id property."""
+@pytest.fixture(scope="module")
+def filled_video():
+    """Video with every field the properties expose set to a distinct value."""
     manifest = VideoManifest(
-        videoId="xyz999", title="Test", channelId="ch1", channelTitle="Test Ch"
-    )
-    video = Video(folder_path=Path("/test"), manifest=manifest)
-
-    assert video.video_id == "xyz999"
-
-
-def test_video_title_property():
-    """Test Video.title property."""
-    manifest = VideoManifest(
-        videoId="vid1",
+        videoId="xyz999",
         title="Amazing Video",
-        channelId="ch1",
-        channelTitle="Test Ch",
-    )
-    video = Video(folder_path=Path("/test"), manifest=manifest)
-
-    assert video.title == "Amazing Video"
-
-
-def test_video_channel_id_property():
-    """Test Video.channel_id property."""
-    manifest = VideoManifest(
-        videoId="vid1", title="Test", channelId="UCxyz123", channelTitle="Test Ch"
-    )
-    video = Video(folder_path=Path("/test"), manifest=manifest)
-
-    assert video.channel_id == "UCxyz123"
-
-
-def test_video_channel_title_property():
-    """Test Video.channel_title property."""
-    manifest = VideoManifest(
-        videoId="vid1", title="Test", channelId="ch1", channelTitle="Great Channel"
-    )
-    video = Video(folder_path=Path("/test"), manifest=manifest)
-
-    assert video.channel_title == "Great Channel"
-
-
-def test_video_tags_property():
-    """Test Video.tags property."""
-    manifest = VideoManifest(
-        videoId="vid1",
-        title="Test",
-        channelId="ch1",
-        channelTitle="Test Ch",
+        channelId="UCxyz123",
+        channelTitle="Great Channel",
         tags=["python", "coding"],
+        publishedAt=datetime(2023, 12, 25, 15, 30, 0),
     )
-    video = Video(folder_path=Path("/test"), manifest=manifest)
+    return Video(folder_path=Path("/test"), manifest=manifest)
 
-    assert video.tags == ["python", "coding"]
 
-
-def test_video_published_at_property():
-    """Test Video.published_at property."""
-    published = datetime(2023, 12, 25, 15, 30, 0)
-    manifest = VideoManifest(
-        videoId="vid1",
-        title="Test",
-        channelId="ch1",
-        channelTitle="Test Ch",
-        publishedAt=published,
-    )
-    video = Video(folder_path=Path("/test"), manifest=manifest)
-
-    assert video.published_at == published
+@pytest.mark.parametrize(
+    "attr, expected",
+    [
+        ("video_id", "xyz999"),
+        ("title", "Amazing Video"),
+        ("channel_id", "UCxyz123"),
+        ("channel_title", "Great Channel"),
+        ("tags", ["python", "coding"]),
+        ("published_at", datetime(2023, 12, 25, 15, 30, 0)),
+    ],
+)
+def test_video_property(filled_video, attr, expected):
+    """Test that Video properties read through to the manifest."""
+    assert getattr(filled_video, attr) == expected
 
 
 def test_video_get_transcript_path():
     """Test Video.get_transcript_path method."""
-    manifest = VideoManifest(
-        videoId="vid1",
-        title="Test",
-        channelId="ch1",
-        channelTitle="Test Ch",
-        source={"transcript_path": "transcript.txt"},
-    )
-    video = Video(folder_path=Path("/library/videos/test"), manifest=manifest)
+    video = make_video("/library/videos/test", source={"transcript_path": "transcript.txt"})
 
     transcript_path = video.get_transcript_path()
     assert transcript_path == Path("/library/videos/test/transcript.txt")
@@ -447,8 +412,7 @@ def test_video_get_transcript_path():
 
 def test_video_get_transcript_path_missing():
     """Test Video.get_transcript_path returns None when not available."""
-    manifest = VideoManifest(videoId="vid1", title="Test", channelId="ch1", channelTitle="Test Ch")
-    video = Video(folder_path=Path("/test"), manifest=manifest)
+    video = make_video("/test")
 
     transcript_path = video.get_transcript_path()
     assert transcript_path is None
@@ -456,14 +420,7 @@ def test_video_get_transcript_path_missing():
 
 def test_video_get_url_path():
     """Test Video.get_url_path method."""
-    manifest = VideoManifest(
-        videoId="vid1",
-        title="Test",
-        channelId="ch1",
-        channelTitle="Test Ch",
-        source={"url_file": "video_url.txt"},
-    )
-    video = Video(folder_path=Path("/library/videos/test"), manifest=manifest)
+    video = make_video("/library/videos/test", source={"url_file": "video_url.txt"})
 
     url_path = video.get_url_path()
     assert url_path == Path("/library/videos/test/video_url.txt")
@@ -471,8 +428,7 @@ def test_video_get_url_path():
 
 def test_video_get_url_path_missing():
     """Test Video.get_url_path returns None when not available."""
-    manifest = VideoManifest(videoId="vid1", title="Test", channelId="ch1", channelTitle="Test Ch")
-    video = Video(folder_path=Path("/test"), manifest=manifest)
+    video = make_video("/test")
 
     url_path = video.get_url_path()
     assert url_path is None
@@ -480,14 +436,10 @@ def test_video_get_url_path_missing():
 
 def test_video_get_summary_path():
     """Test Video.get_summary_path method."""
-    manifest = VideoManifest(
-        videoId="vid1",
-        title="Test",
-        channelId="ch1",
-        channelTitle="Test Ch",
+    video = make_video(
+        "/library/videos/test",
         summaries={"ai": "summaries/ai.md", "shortform": "summaries/short.md"},
     )
-    video = Video(folder_path=Path("/library/videos/test"), manifest=manifest)
 
     ai_path = video.get_summary_path("ai")
     assert ai_path == Path("/library/videos/test/summaries/ai.md")
@@ -501,14 +453,9 @@ def test_video_get_summary_path():
 
 def test_video_list_summaries():
     """Test Video.list_summaries method."""
-    manifest = VideoManifest(
-        videoId="vid1",
-        title="Test",
-        channelId="ch1",
-        channelTitle="Test Ch",
-        summaries={"ai": "ai.md", "shortform": "short.md", "detailed": "detail.md"},
+    video = make_video(
+        "/test", summaries={"ai": "ai.md", "shortform": "short.md", "detailed": "detail.md"}
     )
-    video = Video(folder_path=Path("/test"), manifest=manifest)
 
     summaries = video.list_summaries()
     assert set(summaries) == {"ai", "shortform", "detailed"}
@@ -578,14 +525,8 @@ def test_catalog_to_dict():
 
 def test_catalog_find_book():
     """Test LibraryCatalog.find_book method."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="First Book", author="Author 1", source_folder="first"),
-    )
-    book2 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="Second Book", author="Author 2", source_folder="second"),
-    )
+    book1 = make_book("/test", title="First Book", author="Author 1", source_folder="first")
+    book2 = make_book("/test", title="Second Book", author="Author 2", source_folder="second")
 
     catalog = LibraryCatalog(books=[book1, book2])
 
@@ -603,18 +544,8 @@ def test_catalog_find_book():
 
 def test_catalog_find_video():
     """Test LibraryCatalog.find_video method."""
-    video1 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="vid1", title="Video 1", channelId="ch1", channelTitle="Channel"
-        ),
-    )
-    video2 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="vid2", title="Video 2", channelId="ch2", channelTitle="Channel"
-        ),
-    )
+    video1 = make_video("/test", videoId="vid1", title="Video 1")
+    video2 = make_video("/test", videoId="vid2", title="Video 2", channelId="ch2")
 
     catalog = LibraryCatalog(videos=[video1, video2])
 
@@ -630,278 +561,140 @@ def test_catalog_find_video():
     assert not_found is None
 
 
-def test_catalog_search_books_no_filters():
-    """Test LibraryCatalog.search_books with no filters returns all books."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="Book 1", author="A1", source_folder="b1"),
-    )
-    book2 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="Book 2", author="A2", source_folder="b2"),
-    )
-
-    catalog = LibraryCatalog(books=[book1, book2])
-
-    results = catalog.search_books()
-    assert len(results) == 2
-
-
-def test_catalog_search_books_by_author():
-    """Test LibraryCatalog.search_books by author."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="Book 1", author="Alice", source_folder="b1"),
-    )
-    book2 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="Book 2", author="Bob", source_folder="b2"),
-    )
-
-    catalog = LibraryCatalog(books=[book1, book2])
-
-    results = catalog.search_books(author="Alice")
-    assert len(results) == 1
-    assert results[0].author == "Alice"
-
-    results_partial = catalog.search_books(author="lic")
-    assert len(results_partial) == 1
-    assert results_partial[0].author == "Alice"
-
-
-def test_catalog_search_books_by_category():
-    """Test LibraryCatalog.search_books by category."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(
-            title="Book 1", author="A", source_folder="b1", categories=["ai", "ml"]
-        ),
-    )
-    book2 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="Book 2", author="A", source_folder="b2", categories=["web"]),
-    )
-
-    catalog = LibraryCatalog(books=[book1, book2])
-
-    results = catalog.search_books(category="ai")
-    assert len(results) == 1
-    assert "ai" in results[0].categories
-
-
-def test_catalog_search_books_by_tag():
-    """Test LibraryCatalog.search_books by tag."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(
-            title="Book 1", author="A", source_folder="b1", tags=["python", "advanced"]
-        ),
-    )
-    book2 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="Book 2", author="A", source_folder="b2", tags=["javascript"]),
-    )
-
-    catalog = LibraryCatalog(books=[book1, book2])
-
-    results = catalog.search_books(tag="python")
-    assert len(results) == 1
-    assert "python" in results[0].tags
-
-
-def test_catalog_search_books_by_title():
-    """Test LibraryCatalog.search_books by title."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="Python Programming", author="A", source_folder="b1"),
-    )
-    book2 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="JavaScript Guide", author="A", source_folder="b2"),
-    )
-
-    catalog = LibraryCatalog(books=[book1, book2])
-
-    results = catalog.search_books(title="Python")
-    assert len(results) == 1
-    assert "Python" in results[0].title
-
-
-def test_catalog_search_books_multiple_filters():
-    """Test LibraryCatalog.search_books with multiple filters."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(
-            title="AI with Python",
-            author="Alice",
-            source_folder="b1",
-            categories=["ai"],
-            tags=["python"],
-        ),
-    )
-    book2 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(
-            title="Web Development",
-            author="Bob",
-            source_folder="b2",
-            categories=["web"],
-            tags=["javascript"],
-        ),
-    )
-
-    catalog = LibraryCatalog(books=[book1, book2])
-
-    results = catalog.search_books(author="Alice", category="ai", tag="python")
-    assert len(results) == 1
-    assert results[0].title == "AI with Python"
-
-    results_no_match = catalog.search_books(author="Alice", category="web")
-    assert len(results_no_match) == 0
-
-
-def test_catalog_search_videos_no_filters():
-    """Test LibraryCatalog.search_videos with no filters returns all videos."""
-    video1 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v1", title="Vid 1", channelId="ch1", channelTitle="Channel 1"
-        ),
-    )
-    video2 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v2", title="Vid 2", channelId="ch2", channelTitle="Channel 2"
-        ),
-    )
-
-    catalog = LibraryCatalog(videos=[video1, video2])
-
-    results = catalog.search_videos()
-    assert len(results) == 2
-
-
-def test_catalog_search_videos_by_channel():
-    """Test LibraryCatalog.search_videos by channel."""
-    video1 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v1", title="Vid 1", channelId="ch1", channelTitle="Tech Channel"
-        ),
-    )
-    video2 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v2", title="Vid 2", channelId="ch2", channelTitle="Cooking Show"
-        ),
-    )
-
-    catalog = LibraryCatalog(videos=[video1, video2])
-
-    results = catalog.search_videos(channel="Tech")
-    assert len(results) == 1
-    assert results[0].channel_title == "Tech Channel"
-
-
-def test_catalog_search_videos_by_category():
-    """Test LibraryCatalog.search_videos by category."""
-    video1 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v1",
-            title="Vid 1",
-            channelId="ch1",
-            channelTitle="Ch1",
-            categories=["ai", "tutorial"],
-        ),
-    )
-    video2 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v2",
-            title="Vid 2",
-            channelId="ch2",
-            channelTitle="Ch2",
-            categories=["gaming"],
-        ),
-    )
-
-    catalog = LibraryCatalog(videos=[video1, video2])
-
-    results = catalog.search_videos(category="tutorial")
-    assert len(results) == 1
-    assert "tutorial" in results[0].manifest.categories
-
-
-def test_catalog_search_videos_by_tag():
-    """Test LibraryCatalog.search_videos by tag."""
-    video1 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v1",
-            title="Vid 1",
-            channelId="ch1",
-            channelTitle="Ch1",
-            tags=["python", "coding"],
-        ),
-    )
-    video2 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v2",
-            title="Vid 2",
-            channelId="ch2",
-            channelTitle="Ch2",
-            tags=["gaming"],
-        ),
-    )
-
-    catalog = LibraryCatalog(videos=[video1, video2])
-
-    results = catalog.search_videos(tag="coding")
-    assert len(results) == 1
-    assert "coding" in results[0].tags
-
+def test_catalog_find_sees_appended_and_replaced_items():
+    """Test that lookups reflect items appended to or replacing the catalog lists."""
+    catalog = LibraryCatalog(videos=[make_video("/test", videoId="vid1")])
+    assert catalog.find_video("vid2") is None
+
+    catalog.videos.append(make_video("/test", videoId="vid2", title="Added"))
+    assert catalog.find_video("vid2").title == "Added"
+    assert catalog.find_video_by_title("added").video_id == "vid2"
+
+    catalog.videos = [v for v in catalog.videos if v.video_id != "vid1"]
+    assert catalog.find_video("vid1") is None
+
+
+def test_catalog_find_sees_in_place_edits():
+    """Test that lookups reflect same-length item replacement and field edits."""
+    catalog = LibraryCatalog(books=[make_book("/test", title="T")])
+    catalog.find_book("t")
+
+    catalog.books[0] = make_book("/other", title="Other")
+    assert catalog.find_book("t") is None
+    assert catalog.find_book("other") is catalog.books[0]
+
+    catalog.books[0].manifest.title = "Renamed"
+    assert catalog.find_book("other") is None
+    assert catalog.find_book("renamed") is catalog.books[0]
+
+
+def test_catalog_find_returns_first_duplicate():
+    """Test that duplicate keys resolve to the first matching item."""
+    first = make_book("/first", title="Same Title")
+    catalog = LibraryCatalog(books=[first, make_book("/second", title="same title")])
+
+    assert catalog.find_book("SAME TITLE") is first
+    assert catalog == LibraryCatalog(books=list(catalog.books))
+
+
+@pytest.fixture(scope="module")
+def search_catalog():
+    """Catalog of two books and two videos shared by the read-only search tests."""
+    return LibraryCatalog(
+        books=[
+            make_book(
+                "/test",
+                title="AI with Python",
+                author="Alice",
+                source_folder="b1",
+                categories=["ai", "ml"],
+                tags=["python", "advanced"],
+            ),
+            make_book(
+                "/test",
+                title="Web Development",
+                author="Bob",
+                source_folder="b2",
+                categories=["web"],
+                tags=["javascript"],
+            ),
+        ],
+        videos=[
+            make_video(
+                "/test",
+                videoId="v1",
+                title="Python Tutorial",
+                channelTitle="Tech Channel",
+                categories=["ai", "tutorial"],
+                tags=["python", "coding"],
+            ),
+            make_video(
+                "/test",
+                videoId="v2",
+                title="JavaScript Basics",
+                channelId="ch2",
+                channelTitle="Cooking Show",
+                categories=["gaming"],
+                tags=["gaming"],
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ({}, ["AI with Python", "Web Development"]),
+        ({"author": "Alice"}, ["AI with Python"]),
+        ({"author": "lic"}, ["AI with Python"]),  # Partial match
+        ({"category": "ai"}, ["AI with Python"]),
+        ({"tag": "python"}, ["AI with Python"]),
+        ({"title": "Python"}, ["AI with Python"]),
+        ({"title": "web"}, ["Web Development"]),  # Case-insensitive
+        ({"author": "Alice", "category": "ai", "tag": "python"}, ["AI with Python"]),
+        ({"author": "Alice", "category": "web"}, []),
+    ],
+)
+def test_catalog_search_books(search_catalog, filters, expected):
+    """Test LibraryCatalog.search_books with each filter and combinations of them."""
+    results = search_catalog.search_books(**filters)
+    assert [book.title for book in results] == expected
+
+
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ({}, ["Python Tutorial", "JavaScript Basics"]),
+        ({"channel": "Tech"}, ["Python Tutorial"]),
+        ({"channel": "cook"}, ["JavaScript Basics"]),  # Case-insensitive partial match
+        ({"category": "tutorial"}, ["Python Tutorial"]),
+        ({"tag": "coding"}, ["Python Tutorial"]),
+        ({"title": "Python"}, ["Python Tutorial"]),
+        ({"channel": "Tech", "tag": "gaming"}, []),
+    ],
+)
+def test_catalog_search_videos(search_catalog, filters, expected):
+    """Test LibraryCatalog.search_videos with each filter and combinations of them."""
+    results = search_catalog.search_videos(**filters)
+    assert [video.title for video in results] == expected
 
-def test_catalog_search_videos_by_title():
-    """Test LibraryCatalog.search_videos by title."""
-    video1 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v1",
-            title="Python Tutorial",
-            channelId="ch1",
-            channelTitle="Ch1",
-        ),
-    )
-    video2 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v2", title="JavaScript Basics", channelId="ch2", channelTitle="Ch2"
-        ),
-    )
 
-    catalog = LibraryCatalog(videos=[video1, video2])
+def test_catalog_iter_books_yields_matches_lazily(search_catalog):
+    """Test that iter_books/iter_videos yield matches one at a time, in catalog order."""
+    books = search_catalog.iter_books()
 
-    results = catalog.search_videos(title="Python")
-    assert len(results) == 1
-    assert "Python" in results[0].title
+    assert next(books).title == "AI with Python"
+    assert [book.title for book in books] == ["Web Development"]
+    assert [video.title for video in search_catalog.iter_videos(tag="gaming")] == [
+        "JavaScript Basics"
+    ]
 
 
 def test_catalog_get_all_authors():
     """Test LibraryCatalog.get_all_authors method."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="B1", author="Alice", source_folder="b1"),
-    )
-    book2 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="B2", author="Bob", source_folder="b2"),
-    )
-    book3 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="B3", author="Alice", source_folder="b3"),
-    )
+    book1 = make_book("/test", title="B1", author="Alice", source_folder="b1")
+    book2 = make_book("/test", title="B2", author="Bob", source_folder="b2")
+    book3 = make_book("/test", title="B3", author="Alice", source_folder="b3")
 
     catalog = LibraryCatalog(books=[book1, book2, book3])
 
@@ -909,52 +702,16 @@ def test_catalog_get_all_authors():
     assert authors == ["Alice", "Bob"]
 
 
-def test_catalog_get_all_categories():
+def test_catalog_get_all_categories(search_catalog):
     """Test LibraryCatalog.get_all_categories method."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(title="B1", author="A", source_folder="b1", categories=["ai", "ml"]),
-    )
-    video1 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v1",
-            title="V1",
-            channelId="ch1",
-            channelTitle="Ch1",
-            categories=["tutorial", "ai"],
-        ),
-    )
-
-    catalog = LibraryCatalog(books=[book1], videos=[video1])
+    categories = search_catalog.get_all_categories()
+    assert set(categories) == {"ai", "ml", "web", "tutorial", "gaming"}
 
-    categories = catalog.get_all_categories()
-    assert set(categories) == {"ai", "ml", "tutorial"}
 
-
-def test_catalog_get_all_tags():
+def test_catalog_get_all_tags(search_catalog):
     """Test LibraryCatalog.get_all_tags method."""
-    book1 = Book(
-        folder_path=Path("/test"),
-        manifest=BookManifest(
-            title="B1", author="A", source_folder="b1", tags=["python", "advanced"]
-        ),
-    )
-    video1 = Video(
-        folder_path=Path("/test"),
-        manifest=VideoManifest(
-            videoId="v1",
-            title="V1",
-            channelId="ch1",
-            channelTitle="Ch1",
-            tags=["coding", "python"],
-        ),
-    )
-
-    catalog = LibraryCatalog(books=[book1], videos=[video1])
-
-    tags = catalog.get_all_tags()
-    assert set(tags) == {"python", "advanced", "coding"}
+    tags = search_catalog.get_all_tags()
+    assert set(tags) == {"python", "advanced", "javascript", "coding", "gaming"}
 
 
 def test_catalog_get_stats():
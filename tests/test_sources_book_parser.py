@@ -3,7 +3,9 @@
 from pathlib import Path
 
 import pytest
+from ebooklib import epub
 
+from resourcelibrarian.sources.epub_chapter_extractor import EpubChapterExtractor
 from resourcelibrarian.sources.book_parser import (
     BookParser,
     clean_text,
@@ -44,25 +46,30 @@ def test_detect_format_unsupported():
 # Markdown Parsing Tests
 # ========================================
 
+MARKDOWN_CONTENT = "# Test Book\n\nThis is a test book."
+UNICODE_CONTENT = "# 测试书籍\n\nThis book contains 日本語 and émojis 🎉"
 
-def test_parse_markdown(tmp_path):
-    """Test parsing markdown file."""
-    md_file = tmp_path / "test.md"
-    content = "# Test Book\n\nThis is a test book."
-    md_file.write_text(content, encoding="utf-8")
 
-    result = BookParser.parse_markdown(md_file)
-    assert result == content
+@pytest.fixture(scope="module")
+def book_files(tmp_path_factory):
+    """Directory of small book files shared by the read-only parsing tests."""
+    folder = tmp_path_factory.mktemp("book-files")
+    (folder / "test.md").write_text(MARKDOWN_CONTENT, encoding="utf-8")
+    (folder / "unicode.md").write_text(UNICODE_CONTENT, encoding="utf-8")
+    (folder / "book.txt").write_text("Content")
+    return folder
 
 
-def test_parse_markdown_with_unicode(tmp_path):
-    """Test parsing markdown with Unicode."""
-    md_file = tmp_path / "test.md"
-    content = "# 测试书籍\n\nThis book contains 日本語 and émojis 🎉"
-    md_file.write_text(content, encoding="utf-8")
+def test_parse_markdown(book_files):
+    """Test parsing markdown file."""
+    result = BookParser.parse_markdown(book_files / "test.md")
+    assert result == MARKDOWN_CONTENT
 
-    result = BookParser.parse_markdown(md_file)
-    assert result == content
+
+def test_parse_markdown_with_unicode(book_files):
+    """Test parsing markdown with Unicode."""
+    result = BookParser.parse_markdown(book_files / "unicode.md")
+    assert result == UNICODE_CONTENT
     assert "测试书籍" in result
     assert "日本語" in result
     assert "🎉" in result
@@ -161,23 +168,51 @@ def test_extract_metadata_no_author():
 # ========================================
 
 
-def test_parse_auto_detect_markdown(tmp_path):
+def test_parse_auto_detect_markdown(book_files):
     """Test auto-detection and parsing of markdown."""
-    md_file = tmp_path / "book.md"
-    content = "# Test\nContent"
-    md_file.write_text(content, encoding="utf-8")
+    result = BookParser.parse(book_files / "test.md")
+    assert result == MARKDOWN_CONTENT
 
-    result = BookParser.parse(md_file)
-    assert result == content
 
-
-def test_parse_unsupported_format(tmp_path):
+def test_parse_unsupported_format(book_files):
     """Test that parsing unsupported format raises ValueError."""
-    txt_file = tmp_path / "book.txt"
-    txt_file.write_text("Content")
-
     with pytest.raises(ValueError, match="Unsupported book format"):
-        BookParser.parse(txt_file)
+        BookParser.parse(book_files / "book.txt")
+
+
+def write_epub(path: Path, title: str, body: str) -> None:
+    """Write a minimal single-chapter EPUB."""
+    book = epub.EpubBook()
+    book.set_identifier("test-id")
+    book.set_title(title)
+    book.set_language("en")
+    book.add_author("Test Author")
+    chapter = epub.EpubHtml(title="Chapter", file_name="chapter.xhtml", lang="en")
+    chapter.content = f"<h1>{title}</h1><p>{body}</p>"
+    book.add_item(chapter)
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = [chapter]
+    epub.write_epub(str(path), book)
+
+
+def test_epub_text_and_metadata_reuse_a_read_book(tmp_path, monkeypatch):
+    """Test that a book passed in is used for text and metadata without reading the file."""
+    epub_file = tmp_path / "book.epub"
+    write_epub(epub_file, "Shared Read", "Body text")
+    book = epub.read_epub(epub_file)
+
+    reads = []
+    read_epub = epub.read_epub
+    monkeypatch.setattr(epub, "read_epub", lambda path: reads.append(path) or read_epub(path))
+
+    assert "Body text" in BookParser.parse_epub(epub_file, book=book)
+    assert BookParser.extract_epub_metadata(epub_file, book=book)["title"] == "Shared Read"
+    assert reads == []
+
+    # Without a book each call reads the file itself
+    assert BookParser.extract_epub_metadata(epub_file)["title"] == "Shared Read"
+    assert reads == [epub_file]
 
 
 # ========================================
@@ -223,6 +258,31 @@ def test_html_to_markdown_removes_scripts():
     assert "Content" in result
 
 
+def test_html_to_markdown_removes_uppercase_styles():
+    """Test that style tags are removed regardless of tag case."""
+    html = b"<STYLE>p { color: red; }</STYLE><p>Content</p>"
+    result = BookParser._html_to_markdown(html)
+    assert "color" not in result
+    assert "Content" in result
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-16-le"])
+def test_html_to_markdown_removes_scripts_from_utf16_chapters(tmp_path, encoding):
+    """Test that script and style text is stripped from UTF-16 XHTML, with or without a BOM."""
+    html = (
+        "<html><body><p>Content</p><script>alert('test')</script>"
+        "<style>p { color: red; }</style></body></html>"
+    ).encode(encoding)
+    epub_file = tmp_path / "book.epub"
+    write_epub(epub_file, "Title", "Body")
+    extractor = EpubChapterExtractor(epub_file)
+
+    for result in (BookParser._html_to_markdown(html), extractor._html_to_markdown(html)):
+        assert "Content" in result
+        assert "alert" not in result
+        assert "color" not in result
+
+
 def test_html_to_markdown_excessive_whitespace():
     """Test that excessive whitespace is cleaned up."""
     html = b"<p>Line 1</p><br><br><br><br><p>Line 2</p>"
@@ -0,0 +1,39 @@
+"""Tests for the shared HTML-to-markdown helpers."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from resourcelibrarian.sources.html_markdown import (
+    element_to_markdown,
+    html_to_markdown,
+    may_have_script_or_style,
+)
+
+
+@pytest.mark.parametrize(
+    ("html", "expected"),
+    [
+        (b"<p>Plain</p>", False),
+        (b"<p>Plain</p><SCRIPT>x</SCRIPT>", True),
+        ("<p>Plain</p>", False),
+        ("<p>Plain</p><style>p {}</style>", True),
+        ("<p>Plain</p>".encode("utf-16"), True),
+    ],
+)
+def test_may_have_script_or_style(html, expected):
+    """Test the pre-check for bytes, text and UTF-16 input (which always needs a walk)."""
+    assert may_have_script_or_style(html) is expected
+
+
+def test_element_to_markdown_keeps_spaces_around_inline_tags():
+    """Test that text next to bold and italic tags keeps its surrounding spaces."""
+    soup = BeautifulSoup("<p>Read <b>this</b> and <em>that</em> now</p>", "html.parser")
+
+    assert element_to_markdown(soup.p).strip() == "Read **this** and *that* now"
+
+
+def test_html_to_markdown_uses_body_when_present():
+    """Test that only the body is converted when the document has one."""
+    html = b"<html><head><title>Head</title></head><body><h2>Chapter</h2></body></html>"
+
+    assert html_to_markdown(html) == "## Chapter"
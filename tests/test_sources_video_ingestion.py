@@ -7,43 +7,28 @@ from resourcelibrarian.sources.video_ingestion import (
     create_channel_folder_name,
     create_video_folder_name,
     extract_video_id,
-    slugify,
 )
 
 
-def test_slugify():
-    """Test slugify function."""
-    assert slugify("Hello World") == "hello-world"
-    assert slugify("Test-Title!") == "test-title"
-    assert slugify("Multiple   Spaces") == "multiple-spaces"
-    assert slugify("Special@#$Characters") == "specialcharacters"
-    assert slugify("  Leading and Trailing  ") == "leading-and-trailing"
-
-
-def test_extract_video_id():
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),  # Standard watch URL
+        ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),  # Short URL
+        ("https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ"),  # Embed URL
+        ("https://www.youtube.com/shorts/dQw4w9WgXcQ", "dQw4w9WgXcQ"),  # Shorts URL
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&feature=share", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("dQw4w9WgXcQ", "dQw4w9WgXcQ"),  # Just the ID
+        ("not-a-valid-url", None),
+        ("https://example.com", None),
+        ("short-id", None),  # Not 11 characters
+        ("dQw4w9WgXcQ\n", None),  # Trailing newline is not part of an ID
+    ],
+)
+def test_extract_video_id(url, expected):
     """Test extracting video ID from various YouTube URL formats."""
-    # Standard watch URL
-    assert extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
-
-    # Short URL
-    assert extract_video_id("https://youtu.be/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
-
-    # Embed URL
-    assert extract_video_id("https://www.youtube.com/embed/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
-
-    # With additional parameters
-    assert (
-        extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ&feature=share")
-        == "dQw4w9WgXcQ"
-    )
-
-    # Just the ID
-    assert extract_video_id("dQw4w9WgXcQ") == "dQw4w9WgXcQ"
-
-    # Invalid inputs
-    assert extract_video_id("not-a-valid-url") is None
-    assert extract_video_id("https://example.com") is None
-    assert extract_video_id("short-id") is None  # Not 11 characters
+    assert extract_video_id(url) == expected
 
 
 def test_create_video_folder_name():
@@ -185,6 +170,61 @@ def test_video_ingestion_duplicate_video(tmp_path):
         )
 
 
+def test_video_ingestion_add_videos_batch(tmp_path):
+    """Test adding several videos at once with shared categories and tags."""
+    ingestion = VideoIngestion(tmp_path)
+    entries = [
+        (
+            {"videoId": f"vid{n}", "title": f"Video {n}", "channelId": "UC1", "channelTitle": "Ch"},
+            f"Transcript {n}",
+        )
+        for n in range(3)
+    ]
+
+    videos = ingestion.add_videos(entries, categories=["Education"], tags=["batch"])
+
+    assert [video.video_id for video in videos] == ["vid0", "vid1", "vid2"]
+    for n, video in enumerate(videos):
+        assert video.manifest.categories == ["Education"]
+        assert video.manifest.tags == ["batch"]
+        assert (video.folder_path / "source" / "transcript.txt").read_text() == f"Transcript {n}"
+        assert (video.folder_path / "manifest.yaml").exists()
+
+
+def test_video_ingestion_add_videos_checks_batch_before_writing(tmp_path):
+    """Test that a duplicate within a batch is reported before any video is written."""
+    ingestion = VideoIngestion(tmp_path)
+    metadata = {"videoId": "test123", "title": "Test", "channelId": "UC1", "channelTitle": "Ch"}
+    other = {"videoId": "other45", "title": "Other", "channelId": "UC1", "channelTitle": "Ch"}
+
+    with pytest.raises(ValueError, match="Video already exists"):
+        ingestion.add_videos([(other, "First"), (metadata, "Second"), (metadata, "Third")])
+
+    assert not (tmp_path / "videos").exists()
+
+
+def test_video_ingestion_add_videos_keeps_videos_written_before_io_error(tmp_path, monkeypatch):
+    """Test that a write failure mid-batch leaves the earlier videos in place."""
+    ingestion = VideoIngestion(tmp_path)
+    first = {"videoId": "first12", "title": "First", "channelId": "UC1", "channelTitle": "Ch"}
+    second = {"videoId": "second1", "title": "Second", "channelId": "UC1", "channelTitle": "Ch"}
+
+    write_source_files = VideoIngestion._write_source_files
+
+    def failing_write(video_folder, video_id, transcript_text):
+        if video_id == "second1":
+            raise OSError("disk full")
+        return write_source_files(video_folder, video_id, transcript_text)
+
+    monkeypatch.setattr(VideoIngestion, "_write_source_files", staticmethod(failing_write))
+
+    with pytest.raises(OSError, match="disk full"):
+        ingestion.add_videos([(first, "One"), (second, "Two")])
+
+    written = [path.name for path in (tmp_path / "videos").glob("*/*")]
+    assert written == [create_video_folder_name("first12", "First")]
+
+
 def test_video_ingestion_parses_published_date(tmp_path):
     """Test that VideoIngestion correctly parses publishedAt date."""
     library_path = tmp_path / "library"
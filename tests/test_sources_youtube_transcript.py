@@ -0,0 +1,149 @@
+"""Tests for YouTube transcript fetching."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from youtube_transcript_api import NoTranscriptFound, RequestBlocked
+
+from resourcelibrarian.sources.youtube_transcript import (
+    TranscriptNotAvailableError,
+    YouTubeTranscript,
+)
+
+API_PATH = "resourcelibrarian.sources.youtube_transcript.YouTubeTranscriptApi"
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_api():
+    """Drop the cached API client so each test sees its own patched class."""
+    YouTubeTranscript._api = None
+    yield
+    YouTubeTranscript._api = None
+
+
+def make_transcript(language_code: str, text: str = "hello", is_generated: bool = False):
+    """Create a mock transcript object returning a single snippet."""
+    transcript = MagicMock()
+    transcript.language_code = language_code
+    transcript.is_generated = is_generated
+    transcript.fetch.return_value = [{"text": f" {text} "}]
+    return transcript
+
+
+def test_fetch_transcript_single_lookup_with_language_preferences():
+    """Test that the preferred languages are resolved in one lookup."""
+    transcript = make_transcript("de", "hallo")
+    transcript_list = MagicMock()
+    transcript_list.find_transcript.return_value = transcript
+
+    with patch(API_PATH) as MockApi:
+        MockApi.return_value.list.return_value = transcript_list
+        text, language = YouTubeTranscript.fetch_transcript("abc123def45", language="de")
+
+    assert text == "hallo"
+    assert language == "de"
+    transcript_list.find_transcript.assert_called_once_with(["de", "en"])
+    transcript.fetch.assert_called_once()
+
+
+def test_fetch_transcript_deduplicates_english():
+    """Test that English is not requested twice."""
+    transcript_list = MagicMock()
+    transcript_list.find_transcript.return_value = make_transcript("en")
+
+    with patch(API_PATH) as MockApi:
+        MockApi.return_value.list.return_value = transcript_list
+        YouTubeTranscript.fetch_transcript("abc123def45")
+
+    transcript_list.find_transcript.assert_called_once_with(["en"])
+
+
+def test_fetch_transcript_labels_generated_transcripts_by_code():
+    """Test that auto-generated transcripts report their plain language code."""
+    transcript_list = MagicMock()
+    transcript_list.find_transcript.return_value = make_transcript("en", is_generated=True)
+
+    with patch(API_PATH) as MockApi:
+        MockApi.return_value.list.return_value = transcript_list
+        _, language = YouTubeTranscript.fetch_transcript("abc123def45")
+
+    assert language == "en"
+
+
+def test_fetch_transcript_english_fallback_reports_en():
+    """Test that falling back from the requested language to English reports 'en'."""
+    transcript_list = MagicMock()
+    transcript_list.find_transcript.return_value = make_transcript("en", is_generated=True)
+
+    with patch(API_PATH) as MockApi:
+        MockApi.return_value.list.return_value = transcript_list
+        _, language = YouTubeTranscript.fetch_transcript("abc123def45", language="de")
+
+    assert language == "en"
+
+
+def test_fetch_transcript_falls_back_to_any_available():
+    """Test fallback to the first available transcript in another language."""
+    other = make_transcript("fr", "bonjour")
+    transcript_list = MagicMock()
+    transcript_list.find_transcript.side_effect = NoTranscriptFound("abc123def45", ["en"], [])
+    transcript_list.__iter__.return_value = iter([other])
+
+    with patch(API_PATH) as MockApi:
+        MockApi.return_value.list.return_value = transcript_list
+        text, language = YouTubeTranscript.fetch_transcript("abc123def45")
+
+    assert text == "bonjour"
+    assert language == "fr"
+
+
+def test_fetch_transcript_none_available():
+    """Test that an error is raised when no transcript can be fetched."""
+    transcript_list = MagicMock()
+    transcript_list.find_transcript.side_effect = NoTranscriptFound("abc123def45", ["en"], [])
+    transcript_list.__iter__.return_value = iter([])
+
+    with patch(API_PATH) as MockApi:
+        MockApi.return_value.list.return_value = transcript_list
+        with pytest.raises(TranscriptNotAvailableError):
+            YouTubeTranscript.fetch_transcript("abc123def45")
+
+
+def test_format_transcript_handles_objects_and_dicts():
+    """Test formatting of snippet objects and dict entries."""
+    snippet = MagicMock()
+    snippet.text = "  first  "
+    data = [snippet, {"text": "second "}, {"start": 1.0}]
+
+    assert YouTubeTranscript._format_transcript(data) == "first second"
+
+
+def test_fetch_transcript_does_not_retry_blocked_requests():
+    """Test that a blocked request is reported without trying other transcripts."""
+    transcript = make_transcript("en")
+    transcript.fetch.side_effect = RequestBlocked("abc123def45")
+    other = make_transcript("fr")
+    transcript_list = MagicMock()
+    transcript_list.find_transcript.return_value = transcript
+    transcript_list.__iter__.return_value = iter([other])
+
+    with patch(API_PATH) as MockApi:
+        MockApi.return_value.list.return_value = transcript_list
+        with pytest.raises(TranscriptNotAvailableError, match="Failed to fetch transcript"):
+            YouTubeTranscript.fetch_transcript("abc123def45")
+
+    other.fetch.assert_not_called()
+
+
+def test_fetch_transcript_reuses_api_client():
+    """Test that consecutive fetches share one API client."""
+    transcript_list = MagicMock()
+    transcript_list.find_transcript.return_value = make_transcript("en")
+
+    with patch(API_PATH) as MockApi:
+        MockApi.return_value.list.return_value = transcript_list
+        YouTubeTranscript.fetch_transcript("abc123def45")
+        YouTubeTranscript.fetch_transcript("xyz123def45")
+
+    MockApi.assert_called_once_with()
+    assert MockApi.return_value.list.call_count == 2
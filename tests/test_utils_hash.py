@@ -4,7 +4,12 @@ from pathlib import Path
 
 import pytest
 
-from resourcelibrarian.utils.hash import compute_file_hash, compute_text_hash, short_hash
+from resourcelibrarian.utils.hash import (
+    compute_file_hash,
+    compute_file_hashes,
+    compute_text_hash,
+    short_hash,
+)
 
 
 # ========================================
@@ -81,6 +86,21 @@ def test_compute_text_hash_with_md5():
     assert len(hash_result) == 36  # 'md5_' (4) + 32 hex chars
 
 
+def test_compute_text_hash_accepts_bytes():
+    """Test that pre-encoded bytes hash the same as the equivalent text."""
+    text = "Hello 世界 🌍"
+
+    assert compute_text_hash(text.encode("utf-8")) == compute_text_hash(text)
+
+
+def test_compute_text_hash_uncommon_algorithm():
+    """Test that algorithms without a direct constructor still work."""
+    hash_result = compute_text_hash("Hello", algorithm="sha512")
+
+    assert hash_result.startswith("sha512_")
+    assert len(hash_result) == 7 + 128
+
+
 # ========================================
 # File Hash Tests
 # ========================================
@@ -179,6 +199,30 @@ def test_compute_file_hash_with_md5(tmp_path):
     assert len(hash_result) == 36
 
 
+def test_compute_file_hashes_matches_single_file_hashes(tmp_path):
+    """Test that batch hashing returns each file's hash in the given order."""
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"file{i}.txt"
+        path.write_text(f"content {i}" * 1000)
+        paths.append(path)
+
+    hashes = compute_file_hashes(reversed(paths), algorithm="md5")
+
+    assert list(hashes) == paths[::-1]
+    assert hashes == {path: compute_file_hash(path, algorithm="md5") for path in paths}
+    assert compute_file_hashes([]) == {}
+
+
+def test_compute_file_hashes_missing_file(tmp_path):
+    """Test that batch hashing reports a missing file."""
+    existing = tmp_path / "exists.txt"
+    existing.write_text("content")
+
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        compute_file_hashes([existing, tmp_path / "missing.txt"])
+
+
 # ========================================
 # Short Hash Tests
 # ========================================
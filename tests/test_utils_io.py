@@ -1,5 +1,6 @@
 """Tests for I/O utility functions."""
 
+import enum
 import json
 from pathlib import Path
 
@@ -7,6 +8,7 @@ import pytest
 import yaml
 
 from resourcelibrarian.models import BookManifest, VideoManifest
+from resourcelibrarian.utils import io
 from resourcelibrarian.utils.io import (
     load_book_manifest,
     load_json,
@@ -59,6 +61,92 @@ def test_save_yaml_with_unicode(tmp_path):
     assert loaded_data == test_data
 
 
+def test_save_yaml_replaces_existing_file(tmp_path):
+    """Test that save_yaml overwrites in place without leaving a temp file."""
+    yaml_file = tmp_path / "test.yaml"
+    save_yaml({"version": 1}, yaml_file)
+    save_yaml({"version": 2}, yaml_file)
+
+    assert load_yaml(yaml_file) == {"version": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["test.yaml"]
+
+
+def test_save_yaml_keeps_emoji_readable(tmp_path):
+    """Test that emoji are written literally rather than escaped."""
+    yaml_file = tmp_path / "emoji.yaml"
+    save_yaml({"categories": ["📚", "🎥"]}, yaml_file)
+
+    content = yaml_file.read_text(encoding="utf-8")
+    assert "📚" in content
+    assert "\\U" not in content
+
+
+def test_save_yaml_uses_literal_non_ascii_text(tmp_path):
+    """Test that accented and CJK text is written literally, not escaped."""
+    yaml_file = tmp_path / "text.yaml"
+    save_yaml({"title": "Café — 日本語", "tags": ["naïve"]}, yaml_file)
+
+    content = yaml_file.read_text(encoding="utf-8")
+    assert "title: Café — 日本語" in content
+    assert "- naïve" in content
+
+
+class Shelf(enum.Enum):
+    """Enum value the safe representer cannot serialize."""
+
+    TOP = "top"
+
+
+@pytest.fixture
+def yaml_dumpers(monkeypatch):
+    """Record the Dumper class of every yaml.dump call (None for the default emitter)."""
+    if io.CSafeDumper is None:
+        pytest.skip("PyYAML built without libyaml")
+
+    dumpers = []
+    real_dump = yaml.dump
+
+    def recording_dump(data, stream=None, **kwargs):
+        dumpers.append(kwargs.get("Dumper"))
+        return real_dump(data, stream, **kwargs)
+
+    monkeypatch.setattr(yaml, "dump", recording_dump)
+    return dumpers
+
+
+def test_dump_yaml_uses_libyaml_for_plain_data(yaml_dumpers):
+    """Test that plain manifest data is emitted by libyaml alone."""
+    io._dump_yaml({"title": "Book", "tags": ["a", "b"], "isbn": None})
+
+    assert yaml_dumpers == [io.CSafeDumper]
+
+
+@pytest.mark.parametrize("value", [Path("books/author"), Shelf.TOP])
+def test_dump_yaml_falls_back_on_representer_error(yaml_dumpers, value):
+    """Test that values libyaml's safe representer rejects use the Python emitter."""
+    content = io._dump_yaml({"value": value})
+
+    assert yaml_dumpers == [io.CSafeDumper, None]
+    assert content.startswith(b"value: !!python/object/apply:")
+
+
+def test_dump_yaml_falls_back_for_emoji(yaml_dumpers):
+    """Test that escaped non-BMP characters trigger the Python emitter."""
+    content = io._dump_yaml({"categories": ["📚"]})
+
+    assert yaml_dumpers == [io.CSafeDumper, None]
+    assert "📚".encode() in content
+
+
+def test_save_yaml_round_trips_literal_backslash_u(tmp_path):
+    """Test that a literal backslash-U, e.g. in a Windows path, survives a round trip."""
+    yaml_file = tmp_path / "paths.yaml"
+    data = {"source_folder": "C:\\Users\\reader\\Books", "note": "\\U0001F4DA"}
+    save_yaml(data, yaml_file)
+
+    assert load_yaml(yaml_file) == data
+
+
 def test_load_yaml_file_not_found():
     """Test that load_yaml raises FileNotFoundError for missing files."""
     non_existent = Path("/nonexistent/file.yaml")
@@ -67,6 +155,15 @@ def test_load_yaml_file_not_found():
         load_yaml(non_existent)
 
 
+def test_load_yaml_parent_is_file(tmp_path):
+    """Test that load_yaml raises FileNotFoundError when a parent path is a file."""
+    parent = tmp_path / "parent"
+    parent.write_text("")
+
+    with pytest.raises(FileNotFoundError, match="YAML file not found"):
+        load_yaml(parent / "file.yaml")
+
+
 def test_load_yaml_invalid_yaml(tmp_path):
     """Test that load_yaml raises error for invalid YAML."""
     invalid_yaml = tmp_path / "invalid.yaml"
@@ -130,6 +227,18 @@ def test_save_json_with_unicode(tmp_path):
     assert loaded_data == test_data
 
 
+def test_save_json_failure_keeps_original(tmp_path):
+    """Test that a failed save_json leaves the previous file intact."""
+    json_file = tmp_path / "test.json"
+    save_json({"version": 1}, json_file)
+
+    with pytest.raises(TypeError):
+        save_json({"bad": object()}, json_file)
+
+    assert load_json(json_file) == {"version": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["test.json"]
+
+
 def test_load_json_file_not_found():
     """Test that load_json raises FileNotFoundError for missing files."""
     non_existent = Path("/nonexistent/file.json")
@@ -138,6 +247,15 @@ def test_load_json_file_not_found():
         load_json(non_existent)
 
 
+def test_load_json_parent_is_file(tmp_path):
+    """Test that load_json raises FileNotFoundError when a parent path is a file."""
+    parent = tmp_path / "parent"
+    parent.write_text("")
+
+    with pytest.raises(FileNotFoundError, match="JSON file not found"):
+        load_json(parent / "file.json")
+
+
 def test_load_json_invalid_json(tmp_path):
     """Test that load_json raises error for invalid JSON."""
     invalid_json = tmp_path / "invalid.json"
@@ -197,6 +315,15 @@ def test_load_book_manifest_missing_file(tmp_path):
         load_book_manifest(empty_folder)
 
 
+def test_load_book_manifest_folder_is_file(tmp_path):
+    """Test that load_book_manifest treats a folder path that is a file as missing."""
+    not_a_folder = tmp_path / "not_a_folder"
+    not_a_folder.write_text("")
+
+    with pytest.raises(FileNotFoundError, match="No manifest.yaml found"):
+        load_book_manifest(not_a_folder)
+
+
 def test_book_manifest_round_trip_with_formats(tmp_path):
     """Test book manifest with formats and summaries."""
     manifest = BookManifest(
@@ -268,6 +395,15 @@ def test_load_video_manifest_missing_file(tmp_path):
         load_video_manifest(empty_folder)
 
 
+def test_load_video_manifest_folder_is_file(tmp_path):
+    """Test that load_video_manifest treats a folder path that is a file as missing."""
+    not_a_folder = tmp_path / "not_a_folder"
+    not_a_folder.write_text("")
+
+    with pytest.raises(FileNotFoundError, match="No manifest.yaml found"):
+        load_video_manifest(not_a_folder)
+
+
 def test_video_manifest_round_trip_with_sources(tmp_path):
     """Test video manifest with source files and summaries."""
     manifest = VideoManifest(
@@ -0,0 +1,252 @@
+"""Tests for the on-disk manifest cache."""
+
+import importlib.metadata
+import os
+import pickle
+import time
+
+import pydantic
+import pytest
+from pydantic import create_model
+
+from resourcelibrarian.models import BookManifest, VideoManifest
+from resourcelibrarian.utils import io, manifest_cache
+from resourcelibrarian.utils.io import load_book_manifest, save_book_manifest, save_yaml
+from resourcelibrarian.utils.manifest_cache import (
+    clear_manifest_cache,
+    get_cache_dir,
+    invalidate_cached_manifest,
+    load_cached_manifest,
+    store_cached_manifest,
+)
+
+
+def make_book_manifest(title: str = "Cached Book") -> BookManifest:
+    """Create a minimal book manifest."""
+    return BookManifest(title=title, author="Author", source_folder="author/cached-book")
+
+
+def test_cache_dir_honours_xdg_cache_home(isolated_cache_dir):
+    """Test that the cache lives under $XDG_CACHE_HOME."""
+    assert get_cache_dir() == isolated_cache_dir
+
+
+def test_store_and_load_cached_manifest(tmp_path):
+    """Test that a stored manifest is returned while the file is unchanged."""
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    manifest_path = tmp_path / "manifest.yaml"
+
+    assert load_cached_manifest(manifest_path, BookManifest) is None
+
+    store_cached_manifest(manifest_path, manifest)
+    cached = load_cached_manifest(manifest_path, BookManifest)
+
+    assert cached == manifest
+
+
+def test_cached_manifest_stale_after_edit(tmp_path):
+    """Test that editing the manifest invalidates the cache entry."""
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    manifest_path = tmp_path / "manifest.yaml"
+    store_cached_manifest(manifest_path, manifest)
+
+    save_yaml(make_book_manifest("Edited Title").to_yaml_dict(), manifest_path)
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_cached_manifest(manifest_path, BookManifest) is None
+
+
+def test_cached_manifest_type_mismatch(tmp_path):
+    """Test that a cached entry of another manifest type is ignored."""
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    manifest_path = tmp_path / "manifest.yaml"
+    store_cached_manifest(manifest_path, manifest)
+
+    assert load_cached_manifest(manifest_path, VideoManifest) is None
+
+
+def test_corrupt_cache_entry_is_a_miss(tmp_path):
+    """Test that unreadable cache files are treated as misses."""
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    manifest_path = tmp_path / "manifest.yaml"
+    store_cached_manifest(manifest_path, manifest)
+
+    for cache_file in get_cache_dir().iterdir():
+        cache_file.write_bytes(b"not a pickle")
+
+    assert load_cached_manifest(manifest_path, BookManifest) is None
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pickle.dumps(42),
+        pickle.dumps((1, 2, 3)),
+        b"cnonexistent_module\nMissing\n.",
+        pickle.dumps(make_book_manifest())[:-10],
+    ],
+    ids=["not-a-tuple", "wrong-arity", "missing-class", "truncated"],
+)
+def test_unloadable_cache_entry_is_a_miss(tmp_path, payload):
+    """Test that any failure while unpickling a cache entry is treated as a miss."""
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    manifest_path = tmp_path / "manifest.yaml"
+    store_cached_manifest(manifest_path, manifest)
+
+    for cache_file in get_cache_dir().glob("*.pkl"):
+        cache_file.write_bytes(payload)
+
+    assert load_cached_manifest(manifest_path, BookManifest) is None
+
+
+def test_invalidate_cached_manifest(tmp_path):
+    """Test that invalidation removes the cache entry."""
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    manifest_path = tmp_path / "manifest.yaml"
+    store_cached_manifest(manifest_path, manifest)
+
+    invalidate_cached_manifest(manifest_path)
+
+    assert load_cached_manifest(manifest_path, BookManifest) is None
+
+
+def test_load_book_manifest_populates_cache(tmp_path):
+    """Test that loading a manifest warms the cache and save invalidates it."""
+    save_book_manifest(make_book_manifest(), tmp_path)
+    manifest_path = tmp_path / "manifest.yaml"
+
+    loaded = load_book_manifest(tmp_path)
+    assert load_cached_manifest(manifest_path, BookManifest) == loaded
+
+    save_book_manifest(make_book_manifest("New Title"), tmp_path)
+    assert load_cached_manifest(manifest_path, BookManifest) is None
+    assert load_book_manifest(tmp_path).title == "New Title"
+
+
+def test_load_book_manifest_computes_signature_once_on_miss(tmp_path, monkeypatch):
+    """Test that a cache miss reuses one signature for the lookup and the store."""
+    save_book_manifest(make_book_manifest(), tmp_path)
+    calls = []
+    real_signature = manifest_cache.manifest_signature
+
+    def counting_signature(*args):
+        calls.append(args)
+        return real_signature(*args)
+
+    monkeypatch.setattr(io, "manifest_signature", counting_signature)
+    monkeypatch.setattr(manifest_cache, "manifest_signature", counting_signature)
+    load_book_manifest(tmp_path)
+
+    assert len(calls) == 1
+    assert load_cached_manifest(tmp_path / "manifest.yaml", BookManifest) is not None
+
+
+def test_load_cached_manifest_missing_file(tmp_path):
+    """Test that a missing manifest raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        load_cached_manifest(tmp_path / "manifest.yaml", BookManifest)
+
+
+@pytest.mark.parametrize(
+    ("module", "attribute"), [(manifest_cache, "_PACKAGE_VERSION"), (pydantic, "VERSION")]
+)
+def test_cached_manifest_stale_after_version_change(tmp_path, monkeypatch, module, attribute):
+    """Test that entries written under another package or pydantic version are misses."""
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    manifest_path = tmp_path / "manifest.yaml"
+    store_cached_manifest(manifest_path, manifest)
+
+    version = getattr(module, attribute)
+    monkeypatch.setattr(module, attribute, "0.0.0-other")
+    manifest_cache._schema_fingerprint.cache_clear()
+    try:
+        assert load_cached_manifest(manifest_path, BookManifest) is None
+    finally:
+        monkeypatch.setattr(module, attribute, version)
+        manifest_cache._schema_fingerprint.cache_clear()
+
+    assert load_cached_manifest(manifest_path, BookManifest) == manifest
+
+
+def test_package_version_reads_distribution_metadata(monkeypatch):
+    """Test that the fingerprint version comes from metadata, falling back to __version__."""
+    assert manifest_cache._package_version() == importlib.metadata.version("resource-librarian")
+
+    def not_installed(name):
+        raise importlib.metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(importlib.metadata, "version", not_installed)
+    assert manifest_cache._package_version() == manifest_cache.__version__
+
+
+def test_schema_fingerprint_tracks_model_fields():
+    """Test that adding a field to a manifest model changes its fingerprint."""
+    extended = create_model("BookManifest", __base__=BookManifest, shelf=(str, ""))
+
+    assert manifest_cache._schema_fingerprint(extended) != manifest_cache._schema_fingerprint(
+        BookManifest
+    )
+
+
+def test_store_prunes_old_and_excess_entries(tmp_path, monkeypatch):
+    """Test that the first store in a process evicts expired and excess entries when due."""
+    cache_dir = get_cache_dir()
+    cache_dir.mkdir(parents=True)
+    now = time.time()
+    ages = {"expired": 31 * 86400, "oldest": 3 * 86400, "older": 2 * 86400, "recent": 86400}
+    for name, age in ages.items():
+        entry = cache_dir / f"{name}.pkl"
+        entry.write_bytes(b"")
+        os.utime(entry, (now - age, now - age))
+
+    monkeypatch.setattr(manifest_cache, "_MAX_ENTRIES", 3)
+    monkeypatch.setattr(manifest_cache, "_prune_checked", False)
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    store_cached_manifest(tmp_path / "manifest.yaml", manifest)
+
+    remaining = {entry.stem for entry in cache_dir.glob("*.pkl")}
+    assert "expired" not in remaining
+    assert "oldest" not in remaining
+    assert {"older", "recent"} <= remaining
+    assert len(remaining) == 3
+    assert (cache_dir / manifest_cache._PRUNE_STAMP).exists()
+
+
+def test_store_skips_prune_within_interval(tmp_path, monkeypatch):
+    """Test that a recent prune stamp stops a new process from scanning the cache again."""
+    cache_dir = get_cache_dir()
+    cache_dir.mkdir(parents=True)
+    (cache_dir / manifest_cache._PRUNE_STAMP).touch()
+    expired = cache_dir / "expired.pkl"
+    expired.write_bytes(b"")
+    old = time.time() - 31 * 86400
+    os.utime(expired, (old, old))
+
+    monkeypatch.setattr(manifest_cache, "_prune_checked", False)
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    store_cached_manifest(tmp_path / "manifest.yaml", manifest)
+
+    assert expired.exists()
+
+
+def test_clear_manifest_cache(tmp_path):
+    """Test that clearing removes every cached manifest."""
+    manifest = make_book_manifest()
+    save_book_manifest(manifest, tmp_path)
+    manifest_path = tmp_path / "manifest.yaml"
+    store_cached_manifest(manifest_path, manifest)
+
+    clear_manifest_cache()
+
+    assert load_cached_manifest(manifest_path, BookManifest) is None
+    assert list(get_cache_dir().glob("*.pkl")) == []
@@ -0,0 +1,44 @@
+"""Tests for slug generation."""
+
+import random
+import re
+
+from resourcelibrarian.sources import book_ingestion, video_ingestion
+from resourcelibrarian.utils.slug import slugify
+
+
+def regex_slugify(text: str) -> str:
+    """Reference implementation the translate fast path must match."""
+    text = text.lower()
+    text = re.sub(r"[^\w\s-]", "", text)
+    text = re.sub(r"[-\s]+", "-", text)
+    return text.strip("-")
+
+
+def test_slugify():
+    """Test slugify function."""
+    assert slugify("Hello World") == "hello-world"
+    assert slugify("Test-Title!") == "test-title"
+    assert slugify("Multiple   Spaces") == "multiple-spaces"
+    assert slugify("Special@#$Characters") == "specialcharacters"
+    assert slugify("  Leading and Trailing  ") == "leading-and-trailing"
+
+
+def test_slugify_keeps_non_ascii_letters():
+    """Test that non-ASCII titles keep their letters and still collapse separators."""
+    assert slugify("Café — Déjà Vu_2") == "café-déjà-vu_2"
+    assert slugify("日本語 タイトル!") == "日本語-タイトル"
+
+
+def test_slugify_ascii_fast_path_matches_regex():
+    """Test that the ASCII translate path gives the same slugs as the regex pipeline."""
+    rng = random.Random(0)
+    for _ in range(5000):
+        text = "".join(chr(rng.randrange(128)) for _ in range(rng.randrange(16)))
+        assert slugify(text) == regex_slugify(text), repr(text)
+
+
+def test_ingestion_modules_share_slugify():
+    """Test that book and video folders are named by the same slugify."""
+    assert book_ingestion.slugify is slugify
+    assert video_ingestion.slugify is slugify